@@ -2,12 +2,18 @@
 FastAPI app optimized for Google Cloud Functions
 """
 import os
+from contextlib import asynccontextmanager
 from typing import List
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .routers import authors_gcp, books_gcp, schools_gcp, quotes_gcp, stats_gcp
+from .services.cache_headers import CacheHeadersMiddleware, get_http_cache_enabled_from_env
+from .services.pagination import NEXT_CURSOR_HEADER
+from .services.registry import ServiceRegistry, get_catalog_backend_from_env, get_registry
 
 
 def get_cors_origins_from_env() -> List[str]:
@@ -17,13 +23,44 @@ def get_cors_origins_from_env() -> List[str]:
     return origins
 
 
+def get_compression_min_size_from_env() -> int:
+    """Smallest body (bytes) that gets compressed (COMPRESSION_MIN_SIZE)"""
+    try:
+        return max(0, int(os.getenv("COMPRESSION_MIN_SIZE", "1024")))
+    except ValueError:
+        return 1024
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start shared services once per process and release them on shutdown"""
+    # CATALOG_BACKEND=local serves every read from the bundled JSON
+    registry = ServiceRegistry(backend=get_catalog_backend_from_env())
+    registry.start()
+    registry.start_background_tasks()
+    app.state.services = registry
+    yield
+    await registry.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Filosofía App API - Serverless",
     version="2.0.0",
-    description="Philosophy app API running on Google Cloud Functions + Firestore"
+    description="Philosophy app API running on Google Cloud Functions + Firestore",
+    lifespan=lifespan,
+    # orjson serializes the large list payloads several times faster than json
+    default_response_class=ORJSONResponse
 )
 
+# ETags, 304s and Cache-Control so browsers and the CDN can absorb read traffic
+# (added before CORS so 304 responses get the CORS headers too)
+if get_http_cache_enabled_from_env():
+    app.add_middleware(CacheHeadersMiddleware)
+
+# Gzip responses above COMPRESSION_MIN_SIZE (adds Vary: Accept-Encoding)
+app.add_middleware(GZipMiddleware, minimum_size=get_compression_min_size_from_env())
+
 # CORS configuration
 origins = get_cors_origins_from_env()
 app.add_middleware(
@@ -36,6 +73,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -67,6 +105,12 @@ def healthcheck():
     }
 
 
+@app.get("/metrics", tags=["health"])
+def metrics(request: Request):
+    """Runtime metrics of the shared services (client pool reuse, etc.)"""
+    return get_registry(request).metrics()
+
+
 # Cloud Functions entry point
 # This will be used by functions-framework
 def main(request):
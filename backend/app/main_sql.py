@@ -0,0 +1,74 @@
+"""
+FastAPI app backed by SQL (SQLite locally, Postgres in production)
+"""
+import os
+from contextlib import asynccontextmanager
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from .models.database import dispose_engine, get_database_url_from_env, init_db
+from .models.migrations import run_migrations
+from .models.text_search import detect_search_indexes
+from .routers import authors, books, schools, quotes, stats
+
+
+def get_cors_origins_from_env() -> List[str]:
+    """Get CORS origins from environment variables"""
+    raw = os.getenv("CORS_ORIGINS", "*")
+    return [o.strip() for o in raw.split(",") if o.strip()]
+
+
+def get_create_tables_from_env() -> bool:
+    """Whether to create missing tables on startup (DB_CREATE_TABLES)"""
+    return os.getenv("DB_CREATE_TABLES", "true").lower() not in ("0", "false", "no")
+
+
+def get_run_migrations_from_env() -> bool:
+    """Whether to apply pending migrations on startup (DB_RUN_MIGRATIONS)"""
+    return os.getenv("DB_RUN_MIGRATIONS", "true").lower() not in ("0", "false", "no")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the connection pool once per process and close it on shutdown"""
+    if get_create_tables_from_env():
+        await init_db()
+    if get_run_migrations_from_env():
+        # Search indexes (pg_trgm / FTS5) behind the ?q= filters
+        await run_migrations()
+    # ?q= falls back to ILIKE when the FTS5 tables aren't there
+    await detect_search_indexes()
+    yield
+    await dispose_engine()
+
+
+app = FastAPI(
+    title="Filosofía App API - SQL",
+    version="2.0.0",
+    description="Philosophy app API running on SQLAlchemy (async)",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=get_cors_origins_from_env(),
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["*"],
+)
+
+app.include_router(authors.router)
+app.include_router(books.router)
+app.include_router(schools.router)
+app.include_router(quotes.router)
+app.include_router(stats.router)
+
+
+@app.get("/health")
+async def health_check():
+    """Health check"""
+    return {"status": "healthy", "database": get_database_url_from_env().split("://")[0]}
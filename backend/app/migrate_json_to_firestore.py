@@ -1,96 +1,272 @@
 """
 Migration script to transfer data from JSON files to Firestore
+
+Run from the backend directory:
+    python -m app.migrate_json_to_firestore                      # full migration (skips unchanged records)
+    python -m app.migrate_json_to_firestore sync                 # same, and delete records removed from the JSON
+    python -m app.migrate_json_to_firestore fix-titles           # only fix book titles
+    python -m app.migrate_json_to_firestore reconcile-counters   # only fix counter drift
+    python -m app.migrate_json_to_firestore backfill-random-keys # add sampling keys to old quotes
+
+Set MIGRATION_DATA_FILE to migrate another JSON or NDJSON export; records
+are streamed, so memory use doesn't depend on the file size.
 """
 import os
 import json
+import random
+import hashlib
 import asyncio
-import requests
 from datetime import datetime, timezone
 from pathlib import Path
 from bs4 import BeautifulSoup
-import time
 
 # Firestore imports  
-from services.firestore_service import FirestoreService
-from models.firestore_models import AuthorModel, SchoolModel, BookModel, QuoteModel
+from .services.async_firestore_service import AsyncFirestoreService
+from .services.batch_writer import BatchWriter
+from .services.http_cache import CachedHTTPFetcher
+from .services.json_stream import iter_records
+from .services.json_catalog import (
+    build_school, build_author, build_book, build_quote,
+    author_document_id, school_document_id, book_document_id, quote_document_id,
+    get_librivox_books, get_librivox_ids, get_main_image_url, school_of
+)
+from .models.firestore_models import (
+    AuthorRef, COLLECTIONS, AUTHOR_COUNTERS, RANDOM_KEY_FIELD, CONTENT_HASH_FIELD
+)
+
+# Philosophers whose biographies are fetched (and authors queued) together
+AUTHOR_CHUNK_SIZE = 50
+
+# LibriVox API politeness for fix-titles: request starts are spaced this far
+# apart (at most 2 per second), with up to LIBRIVOX_CONCURRENCY in flight so a
+# slow response doesn't hold back the next ones. Fresh cached responses skip both.
+LIBRIVOX_MIN_INTERVAL = 0.5
+LIBRIVOX_CONCURRENCY = 4
+
+# Collections written by the migration
+MIGRATED_COLLECTIONS = ['schools', 'authors', 'books', 'quotes']
+
+# Fields that change on every write (or are maintained elsewhere) and so
+# aren't part of a record's content hash
+UNHASHED_FIELDS = {'created_at', 'updated_at', RANDOM_KEY_FIELD, CONTENT_HASH_FIELD, *AUTHOR_COUNTERS.values()}
 
 
 class JSONToFirestoreMigrator:
     """Migrates data from JSON files to Firestore"""
     
     def __init__(self):
-        # Firestore setup
-        self.firestore_service = FirestoreService()
+        # Firestore setup (async client so batch commits can overlap)
+        self.firestore_service = AsyncFirestoreService()
+        self.writer = None
         
         # Data paths
         self.data_dir = Path(__file__).parent / "data" / "json"
-        self.philosophers_file = self.data_dir / "philosophers_complete_data.json"
+        # JSON or NDJSON export (MIGRATION_DATA_FILE to load another one)
+        self.philosophers_file = Path(os.getenv("MIGRATION_DATA_FILE", self.data_dir / "philosophers_complete_data.json"))
+        
+        # On-disk cache of scraped pages (SCRAPER_CACHE_DIR to use other fixtures)
+        self.cache_dir = Path(os.getenv("SCRAPER_CACHE_DIR", Path(__file__).parent / "data" / "cache"))
+        self.fetcher = None
         
         # Mapping for relationships
         self.author_id_mapping = {}
         self.school_id_mapping = {}
+        
+        # Content hashes already in Firestore, and what this run produced
+        self.existing_hashes = {name: {} for name in MIGRATED_COLLECTIONS}
+        self.migrated_ids = {name: set() for name in MIGRATED_COLLECTIONS}
+        self.sync_stats = {name: {'new': 0, 'changed': 0, 'unchanged': 0, 'deleted': 0} for name in MIGRATED_COLLECTIONS}
+        
+        # Authors rewritten by this run, whose summaries may be stale elsewhere
+        self.changed_author_ids = set()
     
-    async def migrate_all(self):
-        """Run complete migration"""
+    async def migrate_all(self, prune=False):
+        """Run complete migration
+        
+        Document IDs are derived from each record's natural key and every
+        document stores a hash of its content, so re-running only writes
+        records that are new or changed. With ``prune`` migrated documents
+        whose record is gone from the JSON are deleted too.
+        """
         print("🚀 Starting JSON to Firestore migration...")
         
         # Load JSON data
         await self.load_json_data()
+        await self.load_existing_hashes()
+        
+        # Document IDs are known up front, so relationships are resolved
+        # before anything is written and every collection goes out in
+        # shared, concurrently committed batches
+        self.writer = BatchWriter(self.firestore_service.db)
+        self.assign_author_ids()
         
-        # Migrate in order (due to relationships)
         await self.migrate_schools()
         await self.migrate_authors() 
         await self.migrate_books()
         await self.migrate_quotes()
+        if prune:
+            self.queue_deletions()
+        
+        print("\n⏳ Waiting for pending batches...")
+        await self.writer.flush()
+        self.show_sync_stats()
         
         print("✅ Migration completed successfully!")
         
+        if self.changed_author_ids:
+            await self.refresh_author_summaries()
+        
+        if self.writer.queued:
+            # Bulk writes don't bump the maintained counters; rebuild them (and
+            # the per-author counts) from what is now in the collections
+            await self.reconcile_counters()
+        else:
+            print("\n💤 Firestore already matches the JSON, nothing written")
+        
         # Show stats
         await self.show_stats()
     
     async def load_json_data(self):
-        """Load JSON data from file"""
+        """Index the JSON data file (records themselves are streamed by each stage)"""
         print("📂 Loading JSON data...")
         
         if not self.philosophers_file.exists():
             raise FileNotFoundError(f"JSON file not found: {self.philosophers_file}")
         
-        with open(self.philosophers_file, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
-        
-        philosophers = self.data.get('philosophers', [])
-        print(f"📊 Loaded {len(philosophers)} philosophers from JSON")
+        self.build_indexes()
+        print(f"📊 Loaded {len(self.philosophers_by_id)} philosophers from {self.philosophers_file.name}")
+    
+    def iter_philosophers(self):
+        """Stream the philosopher records from the data file"""
+        return iter_records(self.philosophers_file, 'philosophers')
+    
+    def iter_quotes(self):
+        """Stream the quote records from the data file"""
+        return iter_records(self.philosophers_file, 'quotes')
+    
+    def build_indexes(self):
+        """Index the philosophers in one streaming pass so every stage can look them up in O(1)
+        
+        Only the small fields the lookups need are kept (never the image sets
+        or biographies), so memory doesn't grow with the size of the records.
+        """
+        self.philosophers_by_id = {}
+        self.philosophers_by_school = {}
+        self.philosophers_by_librivox_id = {}
+        
+        for philosopher in self.iter_philosophers():
+            external_id = philosopher.get('id')
+            self.philosophers_by_id[external_id] = {
+                'id': external_id,
+                'name': philosopher.get('name', ''),
+                'document_id': author_document_id(philosopher),
+                'imagen_url': get_main_image_url(philosopher.get('images', {}))
+            }
+            
+            school = school_of(philosopher)
+            if school:
+                self.philosophers_by_school.setdefault(school, []).append(external_id)
+            
+            if philosopher.get('has_ebooks', False):
+                for librivox_id in get_librivox_ids(philosopher):
+                    # A recording shared by several philosophers belongs to the first
+                    self.philosophers_by_librivox_id.setdefault(librivox_id, external_id)
+        
+        print(f"🗂️  Indexed {len(self.philosophers_by_id)} philosophers, "
+              f"{len(self.philosophers_by_school)} schools, "
+              f"{len(self.philosophers_by_librivox_id)} LibriVox books")
     
     async def migrate_schools(self):
         """Extract and migrate philosophical schools"""
         print("\n📚 Migrating schools...")
         
-        # Extract unique schools from philosophers
-        schools_set = set()
-        for philosopher in self.data.get('philosophers', []):
-            school = philosopher.get('school', '').strip()
-            if school and school not in ['', 'N/A', 'Unknown']:
-                schools_set.add(school)
-        
-        schools_list = sorted(list(schools_set))
+        # Unique schools, from the school index
+        schools_list = sorted(self.philosophers_by_school)
         print(f"📚 Found {len(schools_list)} unique schools")
         
+        school_author_ids = self.get_school_author_ids()
+        
         for school_name in schools_list:
             # Create Firestore school
-            firestore_school = SchoolModel(
-                nombre=school_name,
-                descripcion=f"Escuela filosófica: {school_name}",
-                author_ids=[],  # Will be populated when migrating authors
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
+            firestore_school = build_school(school_name, school_author_ids.get(school_name, []))
             
-            firestore_id = await self.firestore_service.create_school(firestore_school)
-            self.school_id_mapping[school_name] = firestore_id
+            doc_id = school_document_id(school_name)
+            status = self.queue_document('schools', doc_id, firestore_school.dict())
+            self.school_id_mapping[school_name] = doc_id
             
-            print(f"  ✓ Migrated school: {school_name}")
+            print(f"  ✓ School ({status}): {school_name} ({len(firestore_school.author_ids)} authors)")
+        
+        print(f"📚 Processed {len(self.school_id_mapping)} schools")
+    
+    def document_ref(self, collection_name, doc_id):
+        """Reference to a document of a migrated collection"""
+        return self.firestore_service.db.collection(COLLECTIONS[collection_name]).document(doc_id)
+    
+    @staticmethod
+    def content_hash(data):
+        """Stable hash of a record's content, ignoring timestamps and maintained fields"""
+        content = {key: value for key, value in data.items() if key not in UNHASHED_FIELDS}
+        canonical = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    async def load_existing_hashes(self):
+        """Read the content hash of every document already in the migrated collections"""
+        print("🔍 Reading existing content hashes...")
         
-        print(f"📚 Migrated {len(self.school_id_mapping)} schools")
+        async def load(collection_name):
+            query = self.firestore_service.db.collection(COLLECTIONS[collection_name]).select([CONTENT_HASH_FIELD])
+            async for doc in query.stream():
+                self.existing_hashes[collection_name][doc.id] = (doc.to_dict() or {}).get(CONTENT_HASH_FIELD)
+        
+        await asyncio.gather(*(load(name) for name in MIGRATED_COLLECTIONS))
+        print(f"🔍 Found {', '.join(f'{len(hashes)} {name}' for name, hashes in self.existing_hashes.items())}")
+    
+    def queue_document(self, collection_name, doc_id, data, on_create=None):
+        """Queue a document write unless Firestore already holds the same content
+        
+        ``on_create`` holds fields only set when the document is new (e.g.
+        counters or the random sampling key), so updates don't reset them.
+        Returns 'new', 'changed' or 'unchanged'.
+        """
+        data[CONTENT_HASH_FIELD] = self.content_hash(data)
+        self.migrated_ids[collection_name].add(doc_id)
+        existing = self.existing_hashes[collection_name]
+        doc_ref = self.document_ref(collection_name, doc_id)
+        
+        if doc_id not in existing:
+            data.update(on_create or {})
+            self.writer.set(collection_name, doc_ref, data)
+            status = 'new'
+        elif existing[doc_id] != data[CONTENT_HASH_FIELD]:
+            data.pop('created_at', None)
+            self.writer.merge(collection_name, doc_ref, data)
+            status = 'changed'
+        else:
+            status = 'unchanged'
+        
+        self.sync_stats[collection_name][status] += 1
+        return status
+    
+    def queue_deletions(self):
+        """Delete migrated documents whose record is no longer in the JSON"""
+        for collection_name, hashes in self.existing_hashes.items():
+            for doc_id, content_hash in hashes.items():
+                # Documents without a hash weren't created by the migration
+                if content_hash is not None and doc_id not in self.migrated_ids[collection_name]:
+                    self.writer.delete(collection_name, self.document_ref(collection_name, doc_id))
+                    self.sync_stats[collection_name]['deleted'] += 1
+    
+    def show_sync_stats(self):
+        """Show what the migration wrote per collection"""
+        print("\n🔁 Sync summary:")
+        for collection_name, counts in self.sync_stats.items():
+            print(f"  {collection_name}: {counts['new']} new, {counts['changed']} changed, "
+                  f"{counts['unchanged']} unchanged, {counts['deleted']} deleted")
+    
+    def assign_author_ids(self):
+        """Derive the document ID of every philosopher before writing anything"""
+        for external_id, philosopher in self.philosophers_by_id.items():
+            self.author_id_mapping[external_id] = philosopher['document_id']
     
     async def extract_biography_from_iep(self, iep_link):
         """Extrae biografía desde el enlace de IEP hasta Table of Contents"""
@@ -98,306 +274,215 @@ class JSONToFirestoreMigrator:
             return None
         
         try:
-            print(f"    📖 Extrayendo biografía de: {iep_link}")
-            
-            # Pausa para ser respetuoso con el servidor
-            time.sleep(1)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; PhilosophyBot/1.0; Educational purpose)'
-            }
-            
-            response = requests.get(iep_link, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Buscar el área de contenido principal
-            content_div = soup.find('div', class_='entry-content') or soup.find('div', id='content')
-            if not content_div:
-                # Alternativa - buscar el primer div con muchos párrafos
-                content_div = soup.find('div', lambda x: x and len(x.find_all('p')) > 3)
-            
-            if not content_div:
+            page = await self.fetcher.fetch(iep_link.strip())
+            if page is None:
                 return None
             
-            # Extraer párrafos hasta "Table of Contents" o títulos similares
-            biography_paragraphs = []
-            stop_keywords = [
-                'table of contents', 'contents', 'outline', 'references',
-                'bibliography', 'further reading', 'see also'
-            ]
-            
-            for element in content_div.find_all(['p', 'h1', 'h2', 'h3', 'h4']):
-                if element.name.startswith('h'):
-                    # Verificar si este título indica el final de la biografía
-                    heading_text = element.get_text().lower().strip()
-                    if any(keyword in heading_text for keyword in stop_keywords):
-                        break
-                elif element.name == 'p':
-                    # Añadir texto del párrafo
-                    paragraph_text = element.get_text().strip()
-                    if paragraph_text and len(paragraph_text) > 50:  # Filtrar párrafos muy cortos
-                        biography_paragraphs.append(paragraph_text)
-                
-                # Parar si tenemos suficiente contenido (3-5 párrafos sustanciales)
-                if len(biography_paragraphs) >= 5:
-                    break
-            
-            if biography_paragraphs:
-                biography = '\n\n'.join(biography_paragraphs)
-                print(f"    ✓ Extraídos {len(biography_paragraphs)} párrafos ({len(biography)} caracteres)")
-                return biography
-            
-            return None
+            # Parsing is cached per page content, so unchanged pages are free
+            biography = self.fetcher.derived('iep_biography', page, self.parse_iep_biography)
+            if biography:
+                source = "caché" if page.from_cache else "IEP"
+                print(f"    ✓ Biografía de {iep_link} ({source}, {len(biography)} caracteres)")
+            return biography
             
-        except requests.exceptions.RequestException as e:
-            print(f"    ❌ Error HTTP extrayendo de {iep_link}: {e}")
-            return None
         except Exception as e:
             print(f"    ❌ Error extrayendo de {iep_link}: {e}")
             return None
+    
+    @staticmethod
+    def parse_iep_biography(content):
+        """Extrae los primeros párrafos de una página de IEP hasta Table of Contents"""
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Buscar el área de contenido principal
+        content_div = soup.find('div', class_='entry-content') or soup.find('div', id='content')
+        if not content_div:
+            # Alternativa - buscar el primer div con muchos párrafos
+            content_div = soup.find('div', lambda x: x and len(x.find_all('p')) > 3)
+        
+        if not content_div:
+            return None
+        
+        # Extraer párrafos hasta "Table of Contents" o títulos similares
+        biography_paragraphs = []
+        stop_keywords = [
+            'table of contents', 'contents', 'outline', 'references',
+            'bibliography', 'further reading', 'see also'
+        ]
+        
+        for element in content_div.find_all(['p', 'h1', 'h2', 'h3', 'h4']):
+            if element.name.startswith('h'):
+                # Verificar si este título indica el final de la biografía
+                heading_text = element.get_text().lower().strip()
+                if any(keyword in heading_text for keyword in stop_keywords):
+                    break
+            elif element.name == 'p':
+                # Añadir texto del párrafo
+                paragraph_text = element.get_text().strip()
+                if paragraph_text and len(paragraph_text) > 50:  # Filtrar párrafos muy cortos
+                    biography_paragraphs.append(paragraph_text)
+            
+            # Parar si tenemos suficiente contenido (3-5 párrafos sustanciales)
+            if len(biography_paragraphs) >= 5:
+                break
+        
+        if biography_paragraphs:
+            biography = '\n\n'.join(biography_paragraphs)
+            return biography
+        
+        return None
+    
+    async def fetch_biographies(self, philosophers):
+        """Fetch the IEP biographies of some philosophers concurrently, by external ID"""
+        print(f"  📖 Fetching IEP biographies for {len(philosophers)} philosophers...")
+        biographies = await asyncio.gather(*(
+            self.extract_biography_from_iep(philosopher.get('iep_link', ''))
+            for philosopher in philosophers
+        ))
+        return {philosopher.get('id'): biography for philosopher, biography in zip(philosophers, biographies)}
+    
+    @staticmethod
+    def iter_chunks(records, size):
+        """Group a record stream into lists of at most ``size``"""
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
     async def migrate_authors(self):
         """Migrate philosophers as authors"""
         print("\n👨‍🎓 Migrating authors...")
         
-        philosophers = self.data.get('philosophers', [])
-        
+        async with CachedHTTPFetcher(
+            self.cache_dir / "iep",
+            headers={'User-Agent': 'Mozilla/5.0 (compatible; PhilosophyBot/1.0; Educational purpose)'}
+        ) as fetcher:
+            self.fetcher = fetcher
+            # Streamed in chunks: bios of a chunk are fetched together, then queued
+            for philosophers in self.iter_chunks(self.iter_philosophers(), AUTHOR_CHUNK_SIZE):
+                biographies = await self.fetch_biographies(philosophers)
+                self.migrate_author_chunk(philosophers, biographies)
+                await self.writer.throttle()
+        
+        print(f"  📖 IEP pages: {fetcher.metrics()}")
+        print(f"👨‍🎓 Processed {len(self.philosophers_by_id)} authors")
+    
+    def migrate_author_chunk(self, philosophers, biographies):
+        """Queue the author documents of a chunk of philosophers"""
         for philosopher in philosophers:
             # Map school relationship
             school_ids = []
-            school_name = philosopher.get('school', '').strip()
+            school_name = school_of(philosopher)
             if school_name and school_name in self.school_id_mapping:
                 school_ids.append(self.school_id_mapping[school_name])
             
-            # Extract biography from IEP link if available
-            biography = None
-            iep_link = philosopher.get('iep_link', '').strip()
-            if iep_link:
-                biography = await self.extract_biography_from_iep(iep_link)
-            
-            # Fallback to existing biography from JSON
-            if not biography:
-                biography = philosopher.get('biography', '')
+            # Biography extracted from the IEP link if available
+            biography = biographies.get(philosopher.get('id'))
             
             # Create Firestore author
-            firestore_author = AuthorModel(
-                external_id=philosopher.get('id'),
-                nombre=philosopher.get('name', ''),
-                username=philosopher.get('username', ''),
-                vida=philosopher.get('life', ''),
-                descripcion_topica=philosopher.get('topical_description', ''),
-                areas_interes=philosopher.get('interests', ''),
-                
-                # Dates from JSON
-                fecha_nacimiento_completa=philosopher.get('birth_date', ''),
-                fecha_muerte_completa=philosopher.get('death_date', ''),
-                año_nacimiento=philosopher.get('birth_year', ''),
-                año_muerte=philosopher.get('death_year', ''),
-                
-                # Location
-                lugar_nacimiento=philosopher.get('birth_place', ''),
-                
-                # School
-                escuela_principal=school_name,
-                school_ids=school_ids,
-                
-                # Links
-                enlace_iep=philosopher.get('iep_link', ''),
-                enlace_stanford=philosopher.get('spe_link', ''),
-                titulo_wiki=philosopher.get('wiki_title', ''),
-                
-                # Images (keep JSON structure)
-                imagenes=philosopher.get('images', {}),
-                imagen_url=self.get_main_image_url(philosopher.get('images', {})),
-                
-                # Books info
-                tiene_libros=philosopher.get('has_ebooks', False),
-                libros_librivox={
-                    'librivox_ids': philosopher.get('librivox_ids', []),
-                    'has_ebooks': philosopher.get('has_ebooks', False)
-                },
-                
-                # Biography (extracted from IEP or from JSON)
-                biografia=biography or '',
-                
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
+            firestore_author = build_author(philosopher, school_ids, biography)
+            
+            status = self.queue_document(
+                'authors',
+                self.author_id_mapping[philosopher.get('id')],
+                firestore_author.dict(),
+                on_create={field: 0 for field in AUTHOR_COUNTERS.values()}
             )
             
-            firestore_id = await self.firestore_service.create_author(firestore_author)
-            self.author_id_mapping[philosopher.get('id')] = firestore_id
+            if status == 'changed':
+                self.changed_author_ids.add(self.author_id_mapping[philosopher.get('id')])
             
-            print(f"  ✓ Migrated author: {philosopher.get('name', 'Unknown')}")
-        
-        # Update schools with author references
-        await self.update_schools_with_authors()
-        
-        print(f"👨‍🎓 Migrated {len(self.author_id_mapping)} authors")
-    
-    def get_main_image_url(self, images_dict):
-        """Extract main image URL from images dict"""
-        if not images_dict:
-            return None
-        
-        # Try to get face image first
-        face_images = images_dict.get('face_images', {})
-        if face_images:
-            return face_images.get('face500x500', face_images.get('face250x250', ''))
-        
-        # Fallback to full image
-        full_images = images_dict.get('full_images', {})
-        if full_images:
-            return full_images.get('full600x800', '')
-        
-        return None
+            print(f"  ✓ Author ({status}): {philosopher.get('name', 'Unknown')}")
     
-    async def update_schools_with_authors(self):
-        """Update schools with their author IDs"""
-        print("  🔗 Updating school-author relationships...")
-        
-        # Count authors by school
-        school_author_counts = {}
-        for philosopher in self.data.get('philosophers', []):
-            school_name = philosopher.get('school', '').strip()
-            if school_name and school_name in self.school_id_mapping:
-                author_external_id = philosopher.get('id')
-                if author_external_id in self.author_id_mapping:
-                    if school_name not in school_author_counts:
-                        school_author_counts[school_name] = []
-                    school_author_counts[school_name].append(
-                        self.author_id_mapping[author_external_id]
-                    )
-        
-        # Update Firestore schools
-        for school_name, author_ids in school_author_counts.items():
-            if school_name in self.school_id_mapping:
-                school_doc = self.firestore_service.db.collection('schools').document(
-                    self.school_id_mapping[school_name]
-                )
-                school_doc.update({'author_ids': author_ids})
-                print(f"    Updated {school_name} with {len(author_ids)} authors")
+    def get_school_author_ids(self):
+        """Author IDs of every school, by school name"""
+        return {
+            school_name: [self.author_id_mapping[external_id] for external_id in external_ids
+                          if external_id in self.author_id_mapping]
+            for school_name, external_ids in self.philosophers_by_school.items()
+        }
     
     async def migrate_books(self):
         """Create books from LibriVox data with cover art"""
         print("\n📖 Migrating books...")
         
         books_created = 0
-        for philosopher in self.data.get('philosophers', []):
+        for philosopher in self.iter_philosophers():
             if not philosopher.get('has_ebooks', False):
                 continue
             
             # Get LibriVox books with detailed info
-            librivox_books = philosopher.get('librivox_books', [])
             author_external_id = philosopher.get('id')
             author_firestore_id = self.author_id_mapping.get(author_external_id)
             
-            if not librivox_books and philosopher.get('librivox_ids'):
-                # Fallback: create books from just IDs
-                for librivox_id in philosopher.get('librivox_ids', []):
-                    librivox_books.append({
-                        'id': str(librivox_id),
-                        'coverArtPath': f'/Images/LibriVox/{librivox_id}.jpg'
-                    })
-            
-            for book_data in librivox_books:
-                librivox_id = book_data.get('id', '')
-                cover_path = book_data.get('coverArtPath', '')
-                
-                # Build full image URLs
-                cover_art_url = ''
-                if cover_path:
-                    if cover_path.startswith('/'):
-                        cover_art_url = f"https://philosophersapi.com{cover_path}"
-                    else:
-                        cover_art_url = cover_path
+            for book_data in get_librivox_books(philosopher):
+                librivox_id = str(book_data.get('id', ''))
+                if self.philosophers_by_librivox_id.get(librivox_id) != author_external_id:
+                    # Already migrated with the philosopher it's indexed under
+                    continue
                 
-                firestore_book = BookModel(
-                    librivox_id=librivox_id,
-                    titulo=f"Obra de {philosopher.get('name', 'Unknown')} (LibriVox {librivox_id})",
-                    descripcion=f"Audiolibro disponible en LibriVox - ID: {librivox_id}",
-                    
-                    # Cover art
-                    imagen_url=cover_art_url,
-                    cover_art_path=cover_path,
-                    
-                    # LibriVox info
-                    librivox_url=book_data.get('getRequestURL', f"https://librivox.org/api/feed/audiobooks/?id={librivox_id}"),
-                    es_audiolibro=True,
-                    
-                    # Author relationship
-                    autor_id=author_firestore_id,
-                    autor_nombre=philosopher.get('name', ''),
-                    
-                    created_at=datetime.now(timezone.utc),
-                    updated_at=datetime.now(timezone.utc)
-                )
+                firestore_book = build_book(philosopher, book_data, author_firestore_id)
                 
-                await self.firestore_service.create_book(firestore_book)
+                status = self.queue_document('books', book_document_id(librivox_id), firestore_book.dict())
                 books_created += 1
+                await self.writer.throttle()
                 
-                if cover_art_url:
-                    print(f"  ✓ Book: {philosopher.get('name')} - LibriVox {librivox_id} (with cover)")
+                if firestore_book.imagen_url:
+                    print(f"  ✓ Book ({status}): {philosopher.get('name')} - LibriVox {librivox_id} (with cover)")
                 else:
-                    print(f"  ✓ Book: {philosopher.get('name')} - LibriVox {librivox_id}")
+                    print(f"  ✓ Book ({status}): {philosopher.get('name')} - LibriVox {librivox_id}")
         
-        print(f"📖 Migrated {books_created} books with cover art")
+        print(f"📖 Processed {books_created} books with cover art")
     
     async def migrate_quotes(self):
         """Migrate real quotes from JSON data"""
         print("\n💬 Migrating quotes from JSON...")
         
-        # Get real quotes from JSON
-        json_quotes = self.data.get('quotes', [])
-        print(f"💬 Found {len(json_quotes)} quotes in JSON")
-        
+        # Real quotes, streamed from the JSON
         quotes_created = 0
-        for quote_data in json_quotes:
-            # Get quote info
-            external_id = quote_data.get('id', '')
-            quote_text = quote_data.get('quote', '').strip()
-            work = quote_data.get('work', '').strip()
-            year = quote_data.get('year', '').strip()
-            philosopher_id = quote_data.get('philosopher_id', '')
-            
-            if not quote_text:
-                continue
-            
+        for quote_data in self.iter_quotes():
             # Find author by philosopher_id
-            author_firestore_id = None
+            philosopher_id = quote_data.get('philosopher_id', '')
+            author = None
             author_name = None
             
             if philosopher_id and philosopher_id in self.author_id_mapping:
-                author_firestore_id = self.author_id_mapping[philosopher_id]
-                # Get author name
-                for philosopher in self.data.get('philosophers', []):
-                    if philosopher.get('id') == philosopher_id:
-                        author_name = philosopher.get('name', '')
-                        break
+                # Author summary embedded on the quote
+                philosopher = self.philosophers_by_id.get(philosopher_id, {})
+                author_name = philosopher.get('name', '')
+                author = AuthorRef(
+                    id=self.author_id_mapping[philosopher_id],
+                    nombre=author_name,
+                    imagen_url=philosopher.get('imagen_url')
+                )
             
-            # Create quote (even without author match)
-            firestore_quote = QuoteModel(
-                external_id=external_id,
-                texto=quote_text,
-                obra=work if work else None,
-                año=year if year else None,
-                autor_id=author_firestore_id,
-                autor_nombre=author_name,
-                philosopher_external_id=philosopher_id,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
+            firestore_quote = build_quote(quote_data, author)
+            if firestore_quote is None:
+                continue
             
-            await self.firestore_service.create_quote(firestore_quote)
+            status = self.queue_document('quotes', quote_document_id(quote_data), firestore_quote.dict(),
+                                         on_create={RANDOM_KEY_FIELD: random.random()})
             quotes_created += 1
+            await self.writer.throttle()
             
             if author_name:
-                print(f"  ✓ Quote: {author_name} - '{quote_text[:50]}...'")
+                print(f"  ✓ Quote ({status}): {author_name} - '{firestore_quote.texto[:50]}...'")
             else:
-                print(f"  ✓ Quote: Unknown author - '{quote_text[:50]}...'")
+                print(f"  ✓ Quote ({status}): Unknown author - '{firestore_quote.texto[:50]}...'")
         
-        print(f"💬 Migrated {quotes_created} real quotes from JSON")
+        print(f"💬 Processed {quotes_created} real quotes from JSON")
+    
+    async def refresh_author_summaries(self):
+        """Fan changed author names/images out to books and quotes not built from the JSON"""
+        print(f"\n🪪 Refreshing author summaries of {len(self.changed_author_ids)} changed authors...")
+        updated = await asyncio.gather(*(
+            self.firestore_service.refresh_author_summaries(author_id) for author_id in self.changed_author_ids
+        ))
+        print(f"🪪 Updated {sum(updated)} books/quotes")
     
     async def show_stats(self):
         """Show final migration statistics"""
@@ -409,63 +494,83 @@ class JSONToFirestoreMigrator:
         print(f"  Books: {stats.get('books_count', 0)}")
         print(f"  Quotes: {stats.get('quotes_count', 0)}")
     
+    async def reconcile_counters(self):
+        """Recompute the maintained counters from the collections"""
+        print("\n🔢 Reconciling counters...")
+        result = await self.firestore_service.reconcile_counters()
+        print(f"  Authors: {result.get('authors_count', 0)}, Schools: {result.get('schools_count', 0)}, "
+              f"Books: {result.get('books_count', 0)}, Quotes: {result.get('quotes_count', 0)}")
+        print(f"  Fixed per-author counts on {result.get('authors_updated', 0)} authors")
+    
+    async def backfill_random_keys(self):
+        """Add random sampling keys to quotes created before they existed"""
+        print("\n🎲 Backfilling quote random keys...")
+        updated = await self.firestore_service.backfill_random_keys()
+        print(f"  Added random keys to {updated} quotes")
+    
     async def fix_book_titles(self):
         """Fix book titles by fetching real titles from LibriVox API"""
         print("\n🔧 Fixing book titles from LibriVox...")
         
-        # Get all books
-        books = await self.firestore_service.get_books(limit=500)
-        
-        # Filter books with 'Obra de' titles
-        books_to_fix = [book for book in books if book.titulo.startswith("Obra de")]
+        # Get all books at once, projected to the fields needed here
+        db = self.firestore_service.db
+        query = db.collection(COLLECTIONS['books']).select(['titulo', 'librivox_id'])
+        books_to_fix = []
+        async for doc in query.stream():
+            book = doc.to_dict() or {}
+            # Filter books with 'Obra de' titles
+            if (book.get('titulo') or '').startswith("Obra de"):
+                books_to_fix.append((doc.id, book))
         
         print(f"📝 Found {len(books_to_fix)} books to fix")
         
-        for i, book in enumerate(books_to_fix):
-            try:
-                print(f"[{i+1}/{len(books_to_fix)}] Processing: {book.titulo}")
-                
-                # Get LibriVox ID
-                librivox_id = book.librivox_id
-                if not librivox_id:
-                    print(f"  ❌ No LibriVox ID for {book.titulo}")
-                    continue
-                    
-                # Fetch real title from LibriVox API
-                print(f"  🌐 Fetching title for LibriVox ID: {librivox_id}")
-                url = f"https://librivox.org/api/feed/audiobooks/?id={librivox_id}&format=json"
-                
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('books') and len(data['books']) > 0:
-                        real_title = data['books'][0]['title']
-                        
-                        if real_title and real_title != book.titulo:
-                            # Update in Firestore
-                            print(f"  ✏️  Updating: '{book.titulo}' → '{real_title}'")
-                            
-                            doc_ref = self.firestore_service.db.collection('books').document(book.id)
-                            doc_ref.update({
-                                'titulo': real_title,
-                                'updated_at': datetime.now(timezone.utc)
-                            })
-                            
-                            print(f"  ✅ Updated successfully!")
-                        else:
-                            print(f"  ℹ️  No change needed")
-                    else:
-                        print(f"  ❌ No book data from LibriVox for ID {librivox_id}")
-                else:
-                    print(f"  ❌ LibriVox API error: {response.status_code}")
-                    
-            except Exception as e:
-                print(f"  ❌ Error processing {book.titulo}: {e}")
-                
-            # Small delay to be respectful to LibriVox API
-            time.sleep(0.5)
+        # LibriVox responses are cached on disk, so re-runs don't hit the API;
+        # uncached lookups run at the LIBRIVOX_* rate
+        async with CachedHTTPFetcher(
+            self.cache_dir / "librivox",
+            concurrency=LIBRIVOX_CONCURRENCY,
+            min_interval=LIBRIVOX_MIN_INTERVAL
+        ) as fetcher:
+            self.fetcher = fetcher
+            titles = await asyncio.gather(*(
+                self.fetch_librivox_title(book.get('librivox_id')) for _, book in books_to_fix
+            ))
+        print(f"🌐 LibriVox responses: {fetcher.metrics()}")
+        
+        self.writer = BatchWriter(db)
+        for (book_id, book), real_title in zip(books_to_fix, titles):
+            if not real_title:
+                print(f"  ❌ No LibriVox title for {book.get('titulo')}")
+            elif real_title != book.get('titulo'):
+                print(f"  ✏️  Updating: '{book.get('titulo')}' → '{real_title}'")
+                self.writer.update('books', self.document_ref('books', book_id), {
+                    'titulo': real_title,
+                    'updated_at': datetime.now(timezone.utc)
+                })
+            else:
+                print(f"  ℹ️  No change needed for '{real_title}'")
+        
+        await self.writer.flush()
+        print(f"🎉 Book title fix completed! Updated {self.writer.queued} books")
+    
+    async def fetch_librivox_title(self, librivox_id):
+        """Real title of a LibriVox audiobook (None if unavailable)"""
+        if not librivox_id:
+            return None
         
-        print("🎉 Book title fix completed!")
+        url = f"https://librivox.org/api/feed/audiobooks/?id={librivox_id}&format=json"
+        try:
+            page = await self.fetcher.fetch(url)
+            if page is None:
+                return None
+            
+            data = page.json()
+            if data.get('books') and len(data['books']) > 0:
+                return data['books'][0].get('title')
+            return None
+        except Exception as e:
+            print(f"  ❌ Error fetching title for LibriVox ID {librivox_id}: {e}")
+            return None
 
 
 async def fix_titles_only():
@@ -483,7 +588,37 @@ async def fix_titles_only():
         traceback.print_exc()
 
 
-async def main():
+async def reconcile_counters_only():
+    """Run only the counter reconciliation without migration"""
+    print("🏛️ Filosofía App - Counter Reconciliation")
+    
+    migrator = JSONToFirestoreMigrator()
+    
+    try:
+        await migrator.reconcile_counters()
+        print("\n🎉 Counters reconciled successfully!")
+    except Exception as e:
+        print(f"❌ Counter reconciliation failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+async def backfill_random_keys_only():
+    """Run only the quote random-key backfill without migration"""
+    print("🏛️ Filosofía App - Quote Random Key Backfill")
+    
+    migrator = JSONToFirestoreMigrator()
+    
+    try:
+        await migrator.backfill_random_keys()
+        print("\n🎉 Random keys backfilled successfully!")
+    except Exception as e:
+        print(f"❌ Random key backfill failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+async def main(prune=False):
     """Main migration function"""
     print("🏴‍☠️ PiratePhilosopher JSON → Firestore Migration")
     print("=" * 50)
@@ -492,7 +627,7 @@ async def main():
     migrator = JSONToFirestoreMigrator()
     
     try:
-        await migrator.migrate_all()
+        await migrator.migrate_all(prune=prune)
         print("\n🎉 Migration completed successfully!")
         print("🔥 Your Firestore database is ready!")
         
@@ -508,6 +643,15 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "fix-titles":
         # Run only the title fix
         asyncio.run(fix_titles_only())
+    elif len(sys.argv) > 1 and sys.argv[1] == "reconcile-counters":
+        # Run only the counter reconciliation
+        asyncio.run(reconcile_counters_only())
+    elif len(sys.argv) > 1 and sys.argv[1] == "backfill-random-keys":
+        # Run only the quote random-key backfill
+        asyncio.run(backfill_random_keys_only())
+    elif len(sys.argv) > 1 and sys.argv[1] == "sync":
+        # Full migration that also deletes records removed from the JSON
+        asyncio.run(main(prune=True))
     else:
         # Run full migration
         asyncio.run(main())
\ No newline at end of file
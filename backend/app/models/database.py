@@ -0,0 +1,116 @@
+"""
+Async SQLAlchemy engine and sessions for the SQL backend
+"""
+import os
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+
+# Local development database (Postgres in production via DATABASE_URL)
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./filosofia.db"
+
+# Sync driver names -> their async counterparts
+ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+class Base(DeclarativeBase):
+    """Declarative base of the SQL models"""
+
+
+def get_database_url_from_env() -> str:
+    """Async database URL (DATABASE_URL; sync driver names are switched to async ones)"""
+    url = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def get_pool_settings_from_env() -> Dict[str, Any]:
+    """Connection pool settings: DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING"""
+    def env_int(name: str, default: int) -> int:
+        try:
+            return int(os.getenv(name, default))
+        except ValueError:
+            return default
+
+    return {
+        "pool_size": max(1, env_int("DB_POOL_SIZE", 5)),
+        "max_overflow": max(0, env_int("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": env_int("DB_POOL_TIMEOUT", 30),
+        # Recycle before typical server/proxy idle timeouts close the connection
+        "pool_recycle": env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() not in ("0", "false", "no"),
+    }
+
+
+def create_engine(url: Optional[str] = None, **overrides: Any) -> AsyncEngine:
+    """Async engine with a pooled, pre-pinged connection pool"""
+    url = make_url(url or get_database_url_from_env())
+    settings = {**get_pool_settings_from_env(), **overrides}
+
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # An in-memory database lives in a single shared connection
+        settings = {"pool_pre_ping": settings["pool_pre_ping"]}
+
+    engine = create_async_engine(url, **settings)
+    if url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+    return engine
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores ON DELETE clauses unless asked per connection
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+_engine: Optional[AsyncEngine] = None
+_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def get_engine() -> AsyncEngine:
+    """Process-wide engine, created on first use"""
+    global _engine, _sessionmaker
+    if _engine is None:
+        _engine = create_engine()
+        # Objects stay usable after commit (no lazy reload on attribute access)
+        _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False)
+    return _engine
+
+
+def get_sessionmaker() -> async_sessionmaker:
+    """Session factory bound to the process-wide engine"""
+    get_engine()
+    return _sessionmaker
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """Dependency yielding a session that's closed after the request"""
+    async with get_sessionmaker()() as session:
+        yield session
+
+
+async def init_db():
+    """Create missing tables (local SQLite databases and tests)"""
+    from . import models  # noqa: F401  (registers the tables on Base.metadata)
+
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def dispose_engine():
+    """Close every pooled connection"""
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
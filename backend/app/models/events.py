@@ -0,0 +1,35 @@
+"""
+Session hooks for in-process caches of the SQL backend
+"""
+from typing import Callable, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+def invalidate_on_commit(invalidate: Callable[[], None], inserted: Tuple[Type, ...] = (),
+                         deleted: Tuple[Type, ...] = ()):
+    """Call ``invalidate`` once a transaction that inserted or deleted the given models commits
+
+    Flushes only mark the session; the cache is dropped after the commit
+    (so a concurrent reload can't pick up uncommitted rows) and a rollback
+    forgets the mark.
+    """
+    key = ("invalidate_on_commit", id(invalidate))
+
+    def after_flush(session, flush_context):
+        if (any(isinstance(obj, inserted) for obj in session.new)
+                or any(isinstance(obj, deleted) for obj in session.deleted)):
+            session.info[key] = True
+
+    def after_commit(session):
+        if session.info.pop(key, False):
+            invalidate()
+
+    def after_rollback(session):
+        session.info.pop(key, None)
+
+    # AsyncSession runs on a sync Session, so these cover both
+    event.listen(Session, "after_flush", after_flush)
+    event.listen(Session, "after_commit", after_commit)
+    event.listen(Session, "after_rollback", after_rollback)
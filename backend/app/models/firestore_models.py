@@ -6,6 +6,13 @@ from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
 
+class AuthorRef(BaseModel):
+    """Compact author summary embedded on books and quotes"""
+    id: str  # Author document ID
+    nombre: Optional[str] = None
+    imagen_url: Optional[str] = None
+
+
 class AuthorModel(BaseModel):
     """Author model for Firestore"""
     # IDs
@@ -94,6 +101,7 @@ class BookModel(BaseModel):
     # Author relationship (denormalized)
     autor_id: Optional[str] = None  # Author document ID
     autor_nombre: Optional[str] = None  # Denormalized for quick access
+    autor_resumen: Optional[AuthorRef] = None  # Denormalized author summary
     
     # Metadata
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -119,6 +127,7 @@ class QuoteModel(BaseModel):
     # Author relationship (denormalized)
     autor_id: Optional[str] = None  # Author document ID
     autor_nombre: Optional[str] = None  # Denormalized for quick access
+    autor_resumen: Optional[AuthorRef] = None  # Denormalized author summary
     philosopher_external_id: Optional[str] = None  # For API mapping
     
     # Metadata
@@ -154,10 +163,82 @@ class QuoteResponse(QuoteModel):
     id: str  # Firestore document ID
 
 
+# Lean models for list views (default ?fields= of the list endpoints)
+class AuthorSummary(BaseModel):
+    """Author fields shown on the authors list"""
+    id: str
+    nombre: str
+    imagen_url: Optional[str] = None
+    vida: Optional[str] = None
+    año_nacimiento: Optional[str] = None
+    año_muerte: Optional[str] = None
+    escuela_principal: Optional[str] = None
+    books_count: int = 0
+    quotes_count: int = 0
+
+
+class BookSummary(BaseModel):
+    """Book fields shown on the books lists"""
+    id: str
+    titulo: str
+    descripcion: Optional[str] = None
+    imagen_url: Optional[str] = None
+    librivox_url: Optional[str] = None
+    es_audiolibro: bool = False
+    autor_id: Optional[str] = None
+    autor_nombre: Optional[str] = None
+    author: Optional[Dict[str, Any]] = None
+
+
+AUTHOR_SUMMARY_FIELDS = tuple(AuthorSummary.model_fields)
+BOOK_SUMMARY_FIELDS = tuple(BookSummary.model_fields)
+
+class BookPage(BaseModel):
+    """A page of books plus the cursor of the next one"""
+    items: List[BookSummary]
+    next_cursor: Optional[str] = None
+
+
+class QuotePage(BaseModel):
+    """A page of quotes plus the cursor of the next one"""
+    items: List[QuoteResponse]
+    next_cursor: Optional[str] = None
+
+
+class AuthorProfile(BaseModel):
+    """Author with the requested related parts (None when not included)"""
+    author: AuthorResponse
+    books: Optional[BookPage] = None
+    quotes: Optional[QuotePage] = None
+    schools: Optional[List[SchoolResponse]] = None
+
+
+# Response-only book fields -> stored fields they're built from
+BOOK_COMPUTED_FIELDS = {'author': ('autor_id', 'autor_nombre', 'autor_resumen')}
+
+# Collections whose documents embed the author summary (autor_resumen)
+AUTHOR_SUMMARY_COLLECTIONS = ('books', 'quotes')
+
+
 # Collection names
 COLLECTIONS = {
     'authors': 'authors',
     'schools': 'schools', 
     'books': 'books',
     'quotes': 'quotes'
-}
\ No newline at end of file
+}
+
+# Document holding the maintained collection counters ({'authors_count': ..., ...})
+COUNTERS_DOC = ('meta', 'counters')
+
+# Per-author counters maintained on each author document
+AUTHOR_COUNTERS = {
+    'books': 'books_count',
+    'quotes': 'quotes_count'
+}
+
+# Uniform random key stored on each quote for O(1) random sampling
+RANDOM_KEY_FIELD = 'rand'
+
+# Hash of a migrated record's source content, so re-syncs only write what changed
+CONTENT_HASH_FIELD = 'content_hash'
@@ -0,0 +1,82 @@
+"""
+Versioned schema migrations for the SQL backend
+
+Run on startup by main_sql (DB_RUN_MIGRATIONS) or by hand:
+    python -m app.models.migrations
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .database import dispose_engine, get_engine
+from .text_search import SEARCH_COLUMNS, postgres_ddl, sqlite_ddl
+
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def _text_search_indexes(conn: Connection):
+    """pg_trgm GIN indexes on Postgres, FTS5 trigram tables on SQLite"""
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        build = postgres_ddl
+    elif dialect == "sqlite":
+        build = sqlite_ddl
+    else:
+        return
+
+    for table, column in SEARCH_COLUMNS.items():
+        for statement in build(table, column):
+            conn.execute(text(statement))
+
+
+# Applied in order, each once, each in its own transaction
+MIGRATIONS: List[Migration] = [
+    Migration(1, "text_search_indexes", _text_search_indexes),
+]
+
+
+async def run_migrations(engine: Optional[AsyncEngine] = None) -> List[int]:
+    """Apply pending migrations and return their versions"""
+    engine = engine or get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(schema_migrations.metadata.create_all)
+        applied = set((await conn.execute(select(schema_migrations.c.version))).scalars())
+
+    done = []
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        async with engine.begin() as conn:
+            await conn.run_sync(migration.upgrade)
+            await conn.execute(schema_migrations.insert().values(version=migration.version, name=migration.name))
+        print(f"✅ Migration {migration.version} ({migration.name}) applied")
+        done.append(migration.version)
+    return done
+
+
+async def main():
+    await run_migrations()
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
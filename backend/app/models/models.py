@@ -0,0 +1,75 @@
+"""
+SQLAlchemy models of the SQL backend
+"""
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import Column, Date, ForeignKey, Integer, String, Table, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .database import Base
+
+
+# Many-to-many link between authors and the schools they belong to
+author_school = Table(
+    "author_school",
+    Base.metadata,
+    Column("author_id", Integer, ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True),
+    Column("school_id", Integer, ForeignKey("schools.id", ondelete="CASCADE"), primary_key=True),
+)
+
+
+class Author(Base):
+    __tablename__ = "authors"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    nombre: Mapped[str] = mapped_column(String(255), index=True)
+    epoca: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    fecha_nacimiento: Mapped[Optional[date]] = mapped_column(Date)
+    fecha_defuncion: Mapped[Optional[date]] = mapped_column(Date)
+    imagen_url: Mapped[Optional[str]] = mapped_column(String(500))
+    biografia: Mapped[Optional[str]] = mapped_column(Text)
+
+    # Relationships are never lazy-loaded under asyncio: queries eager-load
+    # what they return with selectinload(). Deletes leave the children to
+    # the database's ON DELETE rules instead of loading them.
+    schools: Mapped[List["School"]] = relationship(
+        secondary=author_school, back_populates="authors", passive_deletes=True
+    )
+    books: Mapped[List["Book"]] = relationship(back_populates="author", passive_deletes=True)
+    quotes: Mapped[List["Quote"]] = relationship(back_populates="author", passive_deletes=True)
+
+
+class School(Base):
+    __tablename__ = "schools"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    nombre: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    descripcion: Mapped[Optional[str]] = mapped_column(Text)
+    imagen_url: Mapped[Optional[str]] = mapped_column(String(500))
+
+    authors: Mapped[List[Author]] = relationship(
+        secondary=author_school, back_populates="schools", passive_deletes=True
+    )
+
+
+class Book(Base):
+    __tablename__ = "books"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    titulo: Mapped[str] = mapped_column(String(500), index=True)
+    descripcion: Mapped[Optional[str]] = mapped_column(Text)
+    imagen_url: Mapped[Optional[str]] = mapped_column(String(500))
+    autor_id: Mapped[Optional[int]] = mapped_column(ForeignKey("authors.id", ondelete="CASCADE"), index=True)
+
+    author: Mapped[Optional[Author]] = relationship(back_populates="books")
+
+
+class Quote(Base):
+    __tablename__ = "quotes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    texto: Mapped[str] = mapped_column(Text)
+    autor_id: Mapped[Optional[int]] = mapped_column(ForeignKey("authors.id", ondelete="CASCADE"), index=True)
+
+    author: Mapped[Optional[Author]] = relationship(back_populates="quotes")
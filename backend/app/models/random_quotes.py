@@ -0,0 +1,88 @@
+"""
+Random quote sampling for the SQL backend without loading the table
+"""
+import asyncio
+import os
+import random
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .events import invalidate_on_commit
+from .models import Author, Quote
+
+
+def get_quote_ids_ttl_from_env() -> float:
+    """Seconds the cached quote IDs are trusted (QUOTE_IDS_TTL)
+
+    Writes made through this process refresh them right away; the TTL
+    bounds how long writes from other processes go unseen.
+    """
+    try:
+        return max(0.0, float(os.getenv("QUOTE_IDS_TTL", "300")))
+    except ValueError:
+        return 300.0
+
+
+class QuoteSampler:
+    """Picks k random quotes from a cached array of quote IDs
+
+    The IDs are read with an index-only query on the primary key and kept
+    in a compact array (8 bytes per quote); a sample then fetches just the
+    k chosen rows by primary key. Committed inserts and deletes (including
+    authors, whose quotes go with them) mark the array stale.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = get_quote_ids_ttl_from_env() if ttl is None else ttl
+        self._ids = array('q')
+        self._loaded_at: Optional[float] = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Reload the IDs on the next sample"""
+        self._generation += 1
+        self._loaded_at = None
+
+    def _fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def _ids_for(self, session: AsyncSession) -> array:
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    generation = self._generation
+                    result = await session.execute(select(Quote.id))
+                    self._ids = array('q', result.scalars())
+                    # A commit landing during the read leaves the array stale
+                    if generation == self._generation:
+                        self._loaded_at = time.monotonic()
+        return self._ids
+
+    async def sample(self, session: AsyncSession, k: int) -> List[Dict[str, Any]]:
+        """Up to k distinct random quotes as {id, texto, autor_id}"""
+        ids = await self._ids_for(session)
+        chosen = random.sample(ids, min(k, len(ids)))
+        if not chosen:
+            return []
+
+        rows = (await session.execute(
+            select(Quote.id, Quote.texto, Quote.autor_id).where(Quote.id.in_(chosen))
+        )).all()
+        if len(rows) < len(chosen):
+            # Deleted by another process since the IDs were read
+            self.invalidate()
+
+        by_id = {row.id: row for row in rows}
+        return [
+            {"id": row.id, "texto": row.texto, "autor_id": row.autor_id}
+            for row in (by_id.get(quote_id) for quote_id in chosen) if row is not None
+        ]
+
+
+quote_sampler = QuoteSampler()
+invalidate_on_commit(quote_sampler.invalidate, inserted=(Quote,), deleted=(Quote, Author))
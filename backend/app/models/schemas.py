@@ -0,0 +1,108 @@
+"""
+Pydantic schemas of the SQL backend
+"""
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMModel(BaseModel):
+    """Schema readable from SQLAlchemy objects"""
+    model_config = ConfigDict(from_attributes=True)
+
+
+# =====================
+# AUTHORS
+# =====================
+
+class AuthorBase(ORMModel):
+    nombre: str
+    epoca: Optional[str] = None
+    fecha_nacimiento: Optional[date] = None
+    fecha_defuncion: Optional[date] = None
+    imagen_url: Optional[str] = None
+    biografia: Optional[str] = None
+
+
+class AuthorCreate(AuthorBase):
+    pass
+
+
+class AuthorRead(AuthorBase):
+    id: int
+
+
+# =====================
+# SCHOOLS
+# =====================
+
+class SchoolBase(ORMModel):
+    nombre: str
+    descripcion: Optional[str] = None
+    imagen_url: Optional[str] = None
+
+
+class SchoolCreate(SchoolBase):
+    pass
+
+
+class SchoolRead(SchoolBase):
+    id: int
+
+
+class SchoolReadWithRelations(SchoolRead):
+    authors: List[AuthorRead] = []
+
+
+# =====================
+# BOOKS
+# =====================
+
+class BookBase(ORMModel):
+    titulo: str
+    descripcion: Optional[str] = None
+    imagen_url: Optional[str] = None
+    autor_id: Optional[int] = None
+
+
+class BookCreate(BookBase):
+    pass
+
+
+class BookRead(BookBase):
+    id: int
+
+
+class BookWithAuthor(BookRead):
+    author: Optional[AuthorRead] = None
+
+
+# =====================
+# QUOTES
+# =====================
+
+class QuoteBase(ORMModel):
+    texto: str
+    autor_id: Optional[int] = None
+
+
+class QuoteCreate(QuoteBase):
+    pass
+
+
+class QuoteRead(QuoteBase):
+    id: int
+
+
+class QuoteWithAuthor(QuoteRead):
+    author: Optional[AuthorRead] = None
+
+
+# =====================
+# AUTHOR DETAIL
+# =====================
+
+class AuthorReadWithRelations(AuthorRead):
+    schools: List[SchoolRead] = []
+    books: List[BookRead] = []
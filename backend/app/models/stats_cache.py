@@ -0,0 +1,81 @@
+"""
+Library counts for the SQL backend: one query, cached in-process
+"""
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .events import invalidate_on_commit
+from .models import Author, School, Book, Quote
+
+
+# Counted models by response key
+COUNTED_MODELS = {
+    "authors": Author,
+    "schools": School,
+    "books": Book,
+    "quotes": Quote,
+}
+
+
+def get_stats_cache_ttl_from_env() -> float:
+    """Seconds a computed set of counts is served (STATS_CACHE_TTL)"""
+    try:
+        return max(0.0, float(os.getenv("STATS_CACHE_TTL", "60")))
+    except ValueError:
+        return 60.0
+
+
+def counts_query():
+    """All counts in a single statement (one scalar subquery per table)"""
+    return select(*[
+        select(func.count()).select_from(model).scalar_subquery().label(name)
+        for name, model in COUNTED_MODELS.items()
+    ])
+
+
+class StatsCache:
+    """Counts computed with one query and kept for ``ttl`` seconds
+
+    Inserts and deletes committed through this process drop the cached
+    counts (an author's delete also removes their books and quotes), so
+    the TTL only bounds how stale writes from other processes can look.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = get_stats_cache_ttl_from_env() if ttl is None else ttl
+        self._counts: Optional[Dict[str, int]] = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Recount on the next request"""
+        self._generation += 1
+        self._counts = None
+
+    def _fresh(self) -> bool:
+        return self._counts is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def get(self, session: AsyncSession) -> Dict[str, int]:
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    generation = self._generation
+                    row = (await session.execute(counts_query())).one()
+                    counts = dict(row._mapping)
+                    # A commit landing during the query leaves the counts stale
+                    if generation == self._generation:
+                        self._counts = counts
+                        self._loaded_at = time.monotonic()
+                    return dict(counts)
+        return dict(self._counts)
+
+
+stats_cache = StatsCache()
+invalidate_on_commit(stats_cache.invalidate, inserted=tuple(COUNTED_MODELS.values()),
+                     deleted=tuple(COUNTED_MODELS.values()))
@@ -0,0 +1,99 @@
+"""
+Indexed substring search for the SQL backend's ?q= filters
+"""
+from typing import Dict, FrozenSet, List, Optional
+
+from sqlalchemy import bindparam, column as sql_column, select, table as sql_table, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement
+
+from .database import get_engine
+
+
+# Searched column of each table
+SEARCH_COLUMNS: Dict[str, str] = {
+    "authors": "nombre",
+    "schools": "nombre",
+    "books": "titulo",
+    "quotes": "texto",
+}
+
+# Trigram indexes can't narrow down shorter substrings
+MIN_INDEXED_LENGTH = 3
+
+# SQLite FTS5 tables found by detect_search_indexes (none until it runs)
+_fts_tables: FrozenSet[str] = frozenset()
+
+
+def fts_table_name(table: str) -> str:
+    """SQLite FTS5 table mirroring ``table``'s searched column"""
+    return f"{table}_fts"
+
+
+def postgres_ddl(table: str, column: str) -> List[str]:
+    """Trigram GIN index: lets ILIKE '%q%' use an index instead of a sequential scan"""
+    return [
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm ON {table} USING gin ({column} gin_trgm_ops)",
+    ]
+
+
+def sqlite_ddl(table: str, column: str) -> List[str]:
+    """FTS5 trigram table over ``table`` kept in sync by triggers
+
+    The trigram tokenizer answers LIKE '%q%' from its index, so results
+    match the ILIKE filter it replaces.
+    """
+    fts = fts_table_name(table)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column}, content='{table}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+        # Index the rows that existed before the table was created
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+async def detect_search_indexes(engine: Optional[AsyncEngine] = None) -> FrozenSet[str]:
+    """Find which FTS5 tables exist, so searches only use the ones the migration created
+
+    Called once at startup; until then, or when the migration hasn't run
+    (e.g. DB_RUN_MIGRATIONS=false), ?q= filters use a plain ILIKE.
+    """
+    global _fts_tables
+    engine = engine or get_engine()
+    if engine.dialect.name != "sqlite":
+        _fts_tables = frozenset()
+        return _fts_tables
+
+    query = text("SELECT name FROM sqlite_master WHERE type = 'table' AND name IN :names").bindparams(
+        bindparam("names", expanding=True)
+    )
+    async with engine.connect() as conn:
+        result = await conn.execute(query, {"names": [fts_table_name(table) for table in SEARCH_COLUMNS]})
+        _fts_tables = frozenset(result.scalars())
+    return _fts_tables
+
+
+def text_search(session: AsyncSession, attribute: InstrumentedAttribute, q: str) -> ColumnElement:
+    """WHERE clause matching rows whose searched column contains ``q``
+
+    Postgres answers the ILIKE from the pg_trgm index; SQLite looks the
+    row IDs up in the FTS5 table. Other databases, unindexed columns,
+    missing FTS5 tables and queries shorter than a trigram use a plain
+    ILIKE.
+    """
+    pattern = f"%{q}%"
+    table = attribute.class_.__tablename__
+    if (session.bind.dialect.name != "sqlite" or SEARCH_COLUMNS.get(table) != attribute.key
+            or fts_table_name(table) not in _fts_tables or len(q) < MIN_INDEXED_LENGTH):
+        return attribute.ilike(pattern)
+
+    fts = sql_table(fts_table_name(table), sql_column("rowid"), sql_column(attribute.key))
+    return attribute.class_.id.in_(select(fts.c.rowid).where(fts.c[attribute.key].like(pattern)))
@@ -1,38 +1,55 @@
 """
 Authors router for Firestore backend
 """
+import asyncio
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 
-from ..services.firestore_service import FirestoreService
-from ..models.firestore_models import AuthorResponse, BookResponse, QuoteResponse
+from ..services.async_firestore_service import AsyncFirestoreService
+from ..services.fields import InvalidFieldsError, parse_fields, project
+from ..services.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, next_cursor
+from ..services.registry import get_firestore_service
+from ..models.firestore_models import (
+    AuthorResponse, AuthorSummary, BookResponse, BookSummary, QuoteResponse,
+    AuthorProfile, BookPage, QuotePage, AUTHOR_SUMMARY_FIELDS, BOOK_SUMMARY_FIELDS
+)
 
 
 router = APIRouter(prefix="/authors", tags=["authors"])
 
+# Related parts the profile endpoint can include
+PROFILE_PARTS = ('books', 'quotes', 'schools')
 
-def get_firestore_service() -> FirestoreService:
-    """Dependency to get Firestore service"""
-    return FirestoreService()
+# The profile already carries the author, so its books skip the author join
+PROFILE_BOOK_FIELDS = tuple(field for field in BOOK_SUMMARY_FIELDS if field != 'author')
 
 
-@router.get("/", response_model=List[AuthorResponse])
+@router.get("/", response_model=None, responses={200: {"model": List[AuthorSummary]}})
 async def list_authors(
-    q: Optional[str] = Query(default=None, description="Search by name"),
+    response: Response,
+    q: Optional[str] = Query(default=None, description="Full-text search in name and areas of interest"),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    service: FirestoreService = Depends(get_firestore_service)
+    start_after: Optional[str] = Query(default=None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return ('*' for all); defaults to the list summary"),
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
-    """Get paginated list of authors"""
+    """Get paginated list of authors (summaries unless other fields are requested)"""
     try:
+        selected = parse_fields(fields, AuthorResponse, AUTHOR_SUMMARY_FIELDS)
         if q:
-            # Search by name
-            authors = await service.search_authors(query=q, limit=limit)
+            # Ranked search, paginated by offset
+            authors = await service.search_authors(query=q, limit=limit, offset=offset, fields=selected)
         else:
-            # Regular pagination
-            authors = await service.get_authors(limit=limit, offset=offset)
+            # Regular pagination (offset, or keyset cursor for deep pages)
+            authors = await service.get_authors(limit=limit, offset=offset, start_after=start_after, fields=selected)
+            cursor = next_cursor(authors, 'nombre', limit)
+            if cursor:
+                response.headers[NEXT_CURSOR_HEADER] = cursor
         
-        return authors
+        return project(authors, selected)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching authors: {str(e)}")
 
@@ -40,7 +57,7 @@ async def list_authors(
 @router.get("/{author_id}", response_model=AuthorResponse)
 async def get_author(
     author_id: str,
-    service: FirestoreService = Depends(get_firestore_service)
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
     """Get author by ID"""
     try:
@@ -54,24 +71,78 @@ async def get_author(
         raise HTTPException(status_code=500, detail=f"Error fetching author: {str(e)}")
 
 
-@router.get("/{author_id}/books", response_model=List[BookResponse])
+@router.get("/{author_id}/profile", response_model=AuthorProfile)
+async def get_author_profile(
+    author_id: str,
+    include: str = Query(default=",".join(PROFILE_PARTS), description="Comma-separated parts to include: books, quotes, schools"),
+    books_limit: int = Query(default=20, ge=1, le=100),
+    books_start_after: Optional[str] = Query(default=None, description="Cursor from books.next_cursor of the previous profile"),
+    quotes_limit: int = Query(default=20, ge=1, le=100),
+    quotes_start_after: Optional[str] = Query(default=None, description="Cursor from quotes.next_cursor of the previous profile"),
+    service: AsyncFirestoreService = Depends(get_firestore_service)
+):
+    """Get an author with its books, quotes and schools in one round trip"""
+    parts = [part.strip() for part in include.split(",") if part.strip()]
+    unknown = [part for part in parts if part not in PROFILE_PARTS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown profile parts: {', '.join(unknown)}")
+    
+    try:
+        # Every part is keyed by author ID, so all of them are fetched at once
+        reads = {'author': service.get_author(author_id)}
+        if 'books' in parts:
+            reads['books'] = service.get_books(limit=books_limit, autor_id=author_id, start_after=books_start_after, fields=PROFILE_BOOK_FIELDS)
+        if 'quotes' in parts:
+            reads['quotes'] = service.get_quotes(limit=quotes_limit, autor_id=author_id, start_after=quotes_start_after)
+        if 'schools' in parts:
+            reads['schools'] = service.get_author_schools(author_id)
+        results = dict(zip(reads, await asyncio.gather(*reads.values())))
+        
+        if not results['author']:
+            raise HTTPException(status_code=404, detail="Author not found")
+        
+        profile = AuthorProfile(author=results['author'])
+        if 'books' in results:
+            books = results['books']
+            profile.books = BookPage(items=project(books, PROFILE_BOOK_FIELDS), next_cursor=next_cursor(books, 'titulo', books_limit))
+        if 'quotes' in results:
+            quotes = results['quotes']
+            profile.quotes = QuotePage(items=quotes, next_cursor=next_cursor(quotes, 'created_at', quotes_limit))
+        if 'schools' in results:
+            profile.schools = results['schools']
+        
+        return profile
+    except HTTPException:
+        raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching author profile: {str(e)}")
+
+
+@router.get("/{author_id}/books", response_model=None, responses={200: {"model": List[BookSummary]}})
 async def get_author_books(
     author_id: str,
     limit: int = Query(default=50, ge=1, le=100),
-    service: FirestoreService = Depends(get_firestore_service)
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return ('*' for all); defaults to the list summary"),
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
-    """Get books by author"""
+    """Get books by author (summaries unless other fields are requested)"""
     try:
-        # First check if author exists
-        author = await service.get_author(author_id)
-        if not author:
+        selected = parse_fields(fields, BookResponse, BOOK_SUMMARY_FIELDS)
+        # Check the author exists while fetching its books
+        exists, books = await asyncio.gather(
+            service.author_exists(author_id),
+            service.get_books(limit=limit, autor_id=author_id, fields=selected)
+        )
+        if not exists:
             raise HTTPException(status_code=404, detail="Author not found")
         
-        # Get books by author
-        books = await service.get_books(limit=limit, autor_id=author_id)
-        return books
+        return project(books, selected)
     except HTTPException:
         raise
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching author books: {str(e)}")
 
@@ -80,17 +151,18 @@ async def get_author_books(
 async def get_author_quotes(
     author_id: str,
     limit: int = Query(default=50, ge=1, le=100),
-    service: FirestoreService = Depends(get_firestore_service)
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
     """Get quotes by author"""
     try:
-        # First check if author exists
-        author = await service.get_author(author_id)
-        if not author:
+        # Check the author exists while fetching its quotes
+        exists, quotes = await asyncio.gather(
+            service.author_exists(author_id),
+            service.get_quotes(limit=limit, autor_id=author_id)
+        )
+        if not exists:
             raise HTTPException(status_code=404, detail="Author not found")
         
-        # Get quotes by author
-        quotes = await service.get_quotes(limit=limit, autor_id=author_id)
         return quotes
     except HTTPException:
         raise
@@ -1,9 +1,11 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 
 from ..models.database import get_db
+from ..models.text_search import text_search
 from ..models.models import Book
 from ..models.schemas import BookCreate, BookRead, BookWithAuthor
 
@@ -12,60 +14,60 @@ router = APIRouter(prefix="/books", tags=["books"])
 
 
 @router.get("/", response_model=List[BookWithAuthor])
-def list_books(
+async def list_books(
     autor_id: Optional[int] = Query(default=None),
     q: Optional[str] = Query(default=None, description="Buscar por título"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_db),
 ) -> List[BookWithAuthor]:
     stmt = select(Book).options(selectinload(Book.author))
     if autor_id:
         stmt = stmt.where(Book.autor_id == autor_id)
     if q:
-        stmt = stmt.where(Book.titulo.ilike(f"%{q}%"))
+        stmt = stmt.where(text_search(session, Book.titulo, q))
     stmt = stmt.limit(limit).offset(offset)
-    books = session.execute(stmt).scalars().all()
+    books = (await session.execute(stmt)).scalars().all()
     return books
 
 
 @router.get("/{book_id}", response_model=BookRead)
-def get_book(book_id: int, session: Session = Depends(get_db)) -> BookRead:
-    book = session.get(Book, book_id)
+async def get_book(book_id: int, session: AsyncSession = Depends(get_db)) -> BookRead:
+    book = await session.get(Book, book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Libro no encontrado")
     return book
 
 
 @router.post("/", response_model=BookRead, status_code=201)
-def create_book(payload: BookCreate, session: Session = Depends(get_db)) -> BookRead:
+async def create_book(payload: BookCreate, session: AsyncSession = Depends(get_db)) -> BookRead:
     book = Book(**payload.model_dump())
     session.add(book)
-    session.commit()
-    session.refresh(book)
+    await session.commit()
+    await session.refresh(book)
     return book
 
 
 @router.put("/{book_id}", response_model=BookRead)
-def update_book(book_id: int, payload: BookCreate, session: Session = Depends(get_db)) -> BookRead:
-    book = session.get(Book, book_id)
+async def update_book(book_id: int, payload: BookCreate, session: AsyncSession = Depends(get_db)) -> BookRead:
+    book = await session.get(Book, book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Libro no encontrado")
     for key, value in payload.model_dump().items():
         setattr(book, key, value)
     session.add(book)
-    session.commit()
-    session.refresh(book)
+    await session.commit()
+    await session.refresh(book)
     return book
 
 
 @router.delete("/{book_id}", status_code=204)
-def delete_book(book_id: int, session: Session = Depends(get_db)) -> None:
-    book = session.get(Book, book_id)
+async def delete_book(book_id: int, session: AsyncSession = Depends(get_db)) -> None:
+    book = await session.get(Book, book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Libro no encontrado")
-    session.delete(book)
-    session.commit()
+    await session.delete(book)
+    await session.commit()
     return None
 
 
@@ -2,32 +2,41 @@
 Books router for Firestore backend
 """
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 
-from ..services.firestore_service import FirestoreService
-from ..models.firestore_models import BookResponse
+from ..services.async_firestore_service import AsyncFirestoreService
+from ..services.fields import InvalidFieldsError, parse_fields, project
+from ..services.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, next_cursor
+from ..services.registry import get_firestore_service
+from ..models.firestore_models import BookResponse, BookSummary, BOOK_SUMMARY_FIELDS
 
 
 router = APIRouter(prefix="/books", tags=["books"])
 
 
-def get_firestore_service() -> FirestoreService:
-    """Dependency to get Firestore service"""
-    return FirestoreService()
-
-
-@router.get("/", response_model=List[BookResponse])
+@router.get("/", response_model=None, responses={200: {"model": List[BookSummary]}})
 async def list_books(
+    response: Response,
     autor_id: Optional[str] = Query(default=None, description="Filter by author ID"),
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0, description="Number of books to skip"),
     q: Optional[str] = Query(default=None, description="Search in title and description"),
-    service: FirestoreService = Depends(get_firestore_service)
+    start_after: Optional[str] = Query(default=None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated fields to return ('*' for all); defaults to the list summary"),
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
-    """Get list of books, optionally filtered by author and search term"""
+    """Get list of books, optionally filtered by author and search term (summaries unless other fields are requested)"""
     try:
-        books = await service.get_books(limit=limit, offset=offset, autor_id=autor_id, search_query=q)
-        return books
+        selected = parse_fields(fields, BookResponse, BOOK_SUMMARY_FIELDS)
+        books = await service.get_books(limit=limit, offset=offset, autor_id=autor_id, search_query=q, start_after=start_after, fields=selected)
+        
+        # Search results are ranked by relevance, so they page by offset only
+        cursor = next_cursor(books, 'titulo', limit) if not q else None
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+        return project(books, selected)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching books: {str(e)}")
 
@@ -36,7 +45,7 @@ async def list_books(
 async def count_books(
     autor_id: Optional[str] = Query(default=None, description="Filter by author ID"),
     q: Optional[str] = Query(default=None, description="Search in title and description"),
-    service: FirestoreService = Depends(get_firestore_service)
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
     """Get total count of books with optional filters"""
     try:
@@ -1,9 +1,11 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 
 from ..models.database import get_db
+from ..models.text_search import text_search
 from ..models.models import Quote
 from ..models.schemas import QuoteCreate, QuoteRead, QuoteWithAuthor
 
@@ -12,60 +14,60 @@ router = APIRouter(prefix="/quotes", tags=["quotes"])
 
 
 @router.get("/", response_model=List[QuoteWithAuthor])
-def list_quotes(
+async def list_quotes(
     autor_id: Optional[int] = Query(default=None),
     q: Optional[str] = Query(default=None, description="Buscar por texto"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_db),
 ) -> List[QuoteWithAuthor]:
     stmt = select(Quote).options(selectinload(Quote.author))
     if autor_id:
         stmt = stmt.where(Quote.autor_id == autor_id)
     if q:
-        stmt = stmt.where(Quote.texto.ilike(f"%{q}%"))
+        stmt = stmt.where(text_search(session, Quote.texto, q))
     stmt = stmt.limit(limit).offset(offset)
-    quotes = session.execute(stmt).scalars().all()
+    quotes = (await session.execute(stmt)).scalars().all()
     return quotes
 
 
 @router.get("/{quote_id}", response_model=QuoteRead)
-def get_quote(quote_id: int, session: Session = Depends(get_db)) -> QuoteRead:
-    quote = session.get(Quote, quote_id)
+async def get_quote(quote_id: int, session: AsyncSession = Depends(get_db)) -> QuoteRead:
+    quote = await session.get(Quote, quote_id)
     if not quote:
         raise HTTPException(status_code=404, detail="Cita no encontrada")
     return quote
 
 
 @router.post("/", response_model=QuoteRead, status_code=201)
-def create_quote(payload: QuoteCreate, session: Session = Depends(get_db)) -> QuoteRead:
+async def create_quote(payload: QuoteCreate, session: AsyncSession = Depends(get_db)) -> QuoteRead:
     quote = Quote(**payload.model_dump())
     session.add(quote)
-    session.commit()
-    session.refresh(quote)
+    await session.commit()
+    await session.refresh(quote)
     return quote
 
 
 @router.put("/{quote_id}", response_model=QuoteRead)
-def update_quote(quote_id: int, payload: QuoteCreate, session: Session = Depends(get_db)) -> QuoteRead:
-    quote = session.get(Quote, quote_id)
+async def update_quote(quote_id: int, payload: QuoteCreate, session: AsyncSession = Depends(get_db)) -> QuoteRead:
+    quote = await session.get(Quote, quote_id)
     if not quote:
         raise HTTPException(status_code=404, detail="Cita no encontrada")
     for key, value in payload.model_dump().items():
         setattr(quote, key, value)
     session.add(quote)
-    session.commit()
-    session.refresh(quote)
+    await session.commit()
+    await session.refresh(quote)
     return quote
 
 
 @router.delete("/{quote_id}", status_code=204)
-def delete_quote(quote_id: int, session: Session = Depends(get_db)) -> None:
-    quote = session.get(Quote, quote_id)
+async def delete_quote(quote_id: int, session: AsyncSession = Depends(get_db)) -> None:
+    quote = await session.get(Quote, quote_id)
     if not quote:
         raise HTTPException(status_code=404, detail="Cita no encontrada")
-    session.delete(quote)
-    session.commit()
+    await session.delete(quote)
+    await session.commit()
     return None
 
 
@@ -1,41 +1,53 @@
 """
 Quotes router for Firestore backend
 """
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from typing import List, Optional, Union
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 
-from ..services.firestore_service import FirestoreService
+from ..services.async_firestore_service import AsyncFirestoreService
+from ..services.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, next_cursor
+from ..services.registry import get_firestore_service
 from ..models.firestore_models import QuoteResponse
 
 
 router = APIRouter(prefix="/quotes", tags=["quotes"])
 
 
-def get_firestore_service() -> FirestoreService:
-    """Dependency to get Firestore service"""
-    return FirestoreService()
-
-
 @router.get("/", response_model=List[QuoteResponse])
 async def list_quotes(
+    response: Response,
     autor_id: Optional[str] = Query(default=None, description="Filter by author ID"),
     limit: int = Query(default=50, ge=1, le=100),
-    service: FirestoreService = Depends(get_firestore_service)
+    offset: int = Query(default=0, ge=0, description="Number of quotes to skip"),
+    q: Optional[str] = Query(default=None, description="Full-text search in quote text and work"),
+    start_after: Optional[str] = Query(default=None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
-    """Get list of quotes, optionally filtered by author"""
+    """Get list of quotes, optionally filtered by author and search term"""
     try:
-        quotes = await service.get_quotes(limit=limit, autor_id=autor_id)
+        quotes = await service.get_quotes(limit=limit, autor_id=autor_id, start_after=start_after, search_query=q, offset=offset)
+        
+        # Search results are ranked by relevance, so they page by offset only
+        cursor = next_cursor(quotes, 'created_at', limit) if not q else None
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
         return quotes
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching quotes: {str(e)}")
 
 
-@router.get("/random", response_model=QuoteResponse)
+@router.get("/random", response_model=Union[QuoteResponse, List[QuoteResponse]])
 async def get_random_quote(
-    service: FirestoreService = Depends(get_firestore_service)
+    n: Optional[int] = Query(default=None, ge=1, le=50, description="Return a list of n distinct random quotes"),
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
-    """Get a random quote"""
+    """Get a random quote, or n distinct random quotes when n is given"""
     try:
+        if n is not None:
+            return await service.get_random_quotes(n)
+        
         quote = await service.get_random_quote()
         if not quote:
             raise HTTPException(status_code=404, detail="No quotes available")
@@ -4,22 +4,18 @@ Schools router for Firestore backend
 from typing import List
 from fastapi import APIRouter, HTTPException, Query, Depends
 
-from ..services.firestore_service import FirestoreService
+from ..services.async_firestore_service import AsyncFirestoreService
+from ..services.registry import get_firestore_service
 from ..models.firestore_models import SchoolResponse
 
 
 router = APIRouter(prefix="/schools", tags=["schools"])
 
 
-def get_firestore_service() -> FirestoreService:
-    """Dependency to get Firestore service"""
-    return FirestoreService()
-
-
 @router.get("/", response_model=List[SchoolResponse])
 async def list_schools(
     limit: int = Query(default=50, ge=1, le=100),
-    service: FirestoreService = Depends(get_firestore_service)
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
     """Get list of philosophical schools"""
     try:
@@ -32,7 +28,7 @@ async def list_schools(
 @router.get("/{school_id}", response_model=SchoolResponse)
 async def get_school(
     school_id: str,
-    service: FirestoreService = Depends(get_firestore_service)
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
     """Get school by ID"""
     try:
@@ -1,44 +1,19 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.database import get_db
-from ..models.models import Author, School, Book, Quote
-import random
+from ..models.random_quotes import quote_sampler
+from ..models.stats_cache import stats_cache
 
 router = APIRouter()
 
 @router.get("/stats")
-def get_stats(session: Session = Depends(get_db)):
+async def get_stats(session: AsyncSession = Depends(get_db)):
     """Obtiene estadísticas generales de la biblioteca"""
-    stats = {
-        "authors": session.query(func.count(Author.id)).scalar(),
-        "schools": session.query(func.count(School.id)).scalar(),
-        "books": session.query(func.count(Book.id)).scalar(),
-        "quotes": session.query(func.count(Quote.id)).scalar(),
-    }
-    return stats
+    # Una sola consulta con los cuatro conteos, cacheada unos segundos
+    return await stats_cache.get(session)
 
 @router.get("/random-quotes")
-def get_random_quotes(limit: int = 3, session: Session = Depends(get_db)):
+async def get_random_quotes(limit: int = Query(default=3, ge=1, le=50), session: AsyncSession = Depends(get_db)):
     """Obtiene citas aleatorias que cambian cada vez"""
-    # Obtener todas las citas
-    all_quotes = session.query(Quote).all()
-    
-    # Seleccionar aleatoriamente
-    if len(all_quotes) <= limit:
-        selected_quotes = all_quotes
-    else:
-        selected_quotes = random.sample(all_quotes, limit)
-    
-    # Convertir a formato de respuesta
-    result = []
-    for quote in selected_quotes:
-        result.append({
-            "id": quote.id,
-            "texto": quote.texto,
-            "autor_id": quote.autor_id
-        })
-    
-    return result
-
-
+    # Sorteo sobre los IDs en caché: solo se leen las citas elegidas
+    return await quote_sampler.sample(session, limit)
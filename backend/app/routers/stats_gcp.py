@@ -4,20 +4,16 @@ Stats router for Firestore backend
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, Depends
 
-from ..services.firestore_service import FirestoreService
+from ..services.async_firestore_service import AsyncFirestoreService
+from ..services.registry import get_firestore_service
 
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
 
-def get_firestore_service() -> FirestoreService:
-    """Dependency to get Firestore service"""
-    return FirestoreService()
-
-
 @router.get("/", response_model=Dict[str, Any])
 async def get_stats(
-    service: FirestoreService = Depends(get_firestore_service)
+    service: AsyncFirestoreService = Depends(get_firestore_service)
 ):
     """Get application statistics"""
     try:
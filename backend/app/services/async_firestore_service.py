@@ -0,0 +1,705 @@
+"""
+Async Firestore service built on firestore.AsyncClient
+"""
+import asyncio
+import random
+from typing import List, Optional, Dict, Any, Sequence
+from datetime import datetime, timezone
+
+from google.cloud import firestore
+from google.cloud.exceptions import NotFound
+
+from ..models.firestore_models import (
+    AuthorModel, SchoolModel, BookModel, QuoteModel,
+    AuthorResponse, SchoolResponse, BookResponse, QuoteResponse,
+    COLLECTIONS, RANDOM_KEY_FIELD, AUTHOR_COUNTERS, BOOK_COMPUTED_FIELDS, AUTHOR_SUMMARY_COLLECTIONS
+)
+from .client_pool import FirestoreClientPool
+from .fields import projection
+from .firestore_service import FirestoreServiceBase, AuthorMemo, AUTHOR_INFO_FIELDS, IN_QUERY_LIMIT, BATCH_LIMIT
+from .pagination import start_after_values
+from .search_index import CatalogSearchIndex
+
+
+# Draws of random pivots before giving up on filling n distinct quotes
+RANDOM_QUOTE_ROUNDS = 3
+
+
+class AsyncFirestoreService(FirestoreServiceBase):
+    """Service for Firestore operations on firestore.AsyncClient
+
+    Every RPC is awaited on the event loop instead of blocking it, so
+    concurrent requests overlap their Firestore I/O. When a search index is
+    attached, text queries are answered from it instead of Firestore
+    prefix/substring matching.
+    """
+
+    def __init__(self, pool: Optional[FirestoreClientPool] = None, search_index: Optional[CatalogSearchIndex] = None):
+        super().__init__(pool=pool or FirestoreClientPool(size=1, client_factory=firestore.AsyncClient))
+        self.search_index = search_index
+        # Concurrent first writes share one counter seeding
+        self._counters_lock = asyncio.Lock()
+
+    @property
+    def db(self) -> firestore.AsyncClient:
+        """Async Firestore client taken from the shared pool"""
+        return self.pool.acquire()
+
+    # =====================
+    # AUTHORS OPERATIONS
+    # =====================
+
+    async def create_author(self, author_data: AuthorModel) -> str:
+        """Create a new author"""
+        author_dict = author_data.dict()
+        author_dict['created_at'] = datetime.now(timezone.utc)
+        author_dict['updated_at'] = datetime.now(timezone.utc)
+        author_dict.update({field: 0 for field in AUTHOR_COUNTERS.values()})
+
+        db = self.db
+        await self._ensure_counters(db)
+        doc_ref = db.collection(COLLECTIONS['authors']).document()
+        await self._counted_batch(db, 'authors', doc_ref, author_dict).commit()
+        self._index_document('authors', doc_ref.id, author_dict)
+        return doc_ref.id
+
+    async def get_author(self, author_id: str) -> Optional[AuthorResponse]:
+        """Get author by ID"""
+        try:
+            doc_ref = self.db.collection(COLLECTIONS['authors']).document(author_id)
+            doc = await doc_ref.get()
+
+            if not doc.exists:
+                return None
+
+            data = doc.to_dict()
+            data['id'] = doc.id
+
+            # Counts are maintained on the document; older ones fall back to
+            # counting both collections concurrently
+            missing = [field for field in ('books_count', 'quotes_count') if data.get(field) is None]
+            if missing:
+                counters = {
+                    'books_count': self._count_author_books,
+                    'quotes_count': self._count_author_quotes,
+                }
+                counts = await asyncio.gather(*(counters[field](author_id) for field in missing))
+                data.update(zip(missing, counts))
+
+            return AuthorResponse(**data)
+        except Exception as e:
+            print(f"Error getting author {author_id}: {e}")
+            return None
+
+    async def author_exists(self, author_id: str) -> bool:
+        """Check that an author exists without building the full profile"""
+        doc_ref = self.db.collection(COLLECTIONS['authors']).document(author_id)
+        doc = await doc_ref.get(['nombre'])
+        return doc.exists
+
+    async def get_authors(self, limit: int = 50, offset: int = 0, start_after: Optional[str] = None, fields: Optional[Sequence[str]] = None) -> List[AuthorResponse]:
+        """Get paginated list of authors (by offset, or after a cursor)
+
+        With ``fields`` only those fields are read from Firestore (the rest
+        keep their defaults).
+        """
+        query = (self.db.collection(COLLECTIONS['authors'])
+                .order_by('nombre')
+                .order_by('__name__'))
+
+        if start_after:
+            query = query.start_after(start_after_values(start_after, 'nombre'))
+
+        query = query.limit(limit).offset(offset)
+        field_paths = projection(fields, required=['nombre'])
+        if field_paths is not None:
+            query = query.select(field_paths)
+
+        authors = []
+        async for doc in query.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+
+            # For list view, only use the counts already stored on the document
+            data.setdefault('books_count', 0)
+            data.setdefault('quotes_count', 0)
+
+            authors.append(AuthorResponse(**data))
+
+        return authors
+
+    async def search_authors(self, query: str, limit: int = 20, offset: int = 0, fields: Optional[Sequence[str]] = None) -> List[AuthorResponse]:
+        """Search authors by name and areas of interest"""
+        field_paths = projection(fields, required=['nombre'])
+        if self.search_index is not None:
+            authors = []
+            for data in await self._search('authors', query, limit, offset, field_paths=field_paths):
+                data.setdefault('books_count', 0)
+                data.setdefault('quotes_count', 0)
+                authors.append(AuthorResponse(**data))
+            return authors
+
+        authors_ref = self.db.collection(COLLECTIONS['authors'])
+
+        # Search by name (prefix)
+        query_ref = (authors_ref
+                    .where('nombre', '>=', query)
+                    .where('nombre', '<=', query + '\uf8ff')
+                    .offset(offset)
+                    .limit(limit))
+        if field_paths is not None:
+            query_ref = query_ref.select(field_paths)
+
+        authors = []
+        async for doc in query_ref.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            data.setdefault('books_count', 0)
+            data.setdefault('quotes_count', 0)
+            authors.append(AuthorResponse(**data))
+
+        return authors
+
+    async def update_author(self, author_id: str, updates: Dict[str, Any]) -> bool:
+        """Update an author, refreshing the summary embedded on its books and quotes"""
+        doc_ref = self.db.collection(COLLECTIONS['authors']).document(author_id)
+        try:
+            await doc_ref.update({**updates, 'updated_at': datetime.now(timezone.utc)})
+        except NotFound:
+            return False
+
+        if any(field in updates for field in AUTHOR_INFO_FIELDS):
+            await self.refresh_author_summaries(author_id)
+        return True
+
+    async def refresh_author_summaries(self, author_id: str) -> int:
+        """Rewrite the author summary on every book and quote of an author (fan-out)"""
+        db = self.db
+        doc = await db.collection(COLLECTIONS['authors']).document(author_id).get(AUTHOR_INFO_FIELDS)
+        if not doc.exists:
+            return 0
+        summary = self._author_summary(author_id, doc.to_dict())
+        # Bumped so ETags and the search index's incremental refresh see the change
+        now = datetime.now(timezone.utc)
+
+        batch = db.batch()
+        pending = 0
+        updated = 0
+        for collection_name in AUTHOR_SUMMARY_COLLECTIONS:
+            query = (db.collection(COLLECTIONS[collection_name])
+                    .where('autor_id', '==', author_id)
+                    .select(['autor_nombre', 'autor_resumen']))
+            async for doc in query.stream():
+                # Only rewrite the documents whose summary is out of date
+                if not self._summary_changed(doc.to_dict() or {}, summary):
+                    continue
+
+                batch.update(doc.reference, {'autor_nombre': summary['nombre'], 'autor_resumen': summary, 'updated_at': now})
+                pending += 1
+                updated += 1
+                if pending == BATCH_LIMIT:
+                    await batch.commit()
+                    batch = db.batch()
+                    pending = 0
+
+        if pending:
+            await batch.commit()
+        return updated
+
+    # =====================
+    # SCHOOLS OPERATIONS
+    # =====================
+
+    async def create_school(self, school_data: SchoolModel) -> str:
+        """Create a new school"""
+        school_dict = school_data.dict()
+        school_dict['created_at'] = datetime.utcnow()
+        school_dict['updated_at'] = datetime.utcnow()
+
+        db = self.db
+        await self._ensure_counters(db)
+        doc_ref = db.collection(COLLECTIONS['schools']).document()
+        await self._counted_batch(db, 'schools', doc_ref, school_dict).commit()
+        return doc_ref.id
+
+    async def get_school(self, school_id: str) -> Optional[SchoolResponse]:
+        """Get school by ID"""
+        try:
+            doc_ref = self.db.collection(COLLECTIONS['schools']).document(school_id)
+            doc = await doc_ref.get()
+
+            if not doc.exists:
+                return None
+
+            data = doc.to_dict()
+            data['id'] = doc.id
+            data['authors_count'] = len(data.get('author_ids', []))
+
+            return SchoolResponse(**data)
+        except Exception as e:
+            print(f"Error getting school {school_id}: {e}")
+            return None
+
+    async def get_schools(self, limit: int = 50) -> List[SchoolResponse]:
+        """Get list of schools"""
+        query = (self.db.collection(COLLECTIONS['schools'])
+                .order_by('nombre')
+                .limit(limit))
+
+        schools = []
+        async for doc in query.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            data['authors_count'] = len(data.get('author_ids', []))
+            schools.append(SchoolResponse(**data))
+
+        return schools
+
+    async def get_author_schools(self, author_id: str) -> List[SchoolResponse]:
+        """Get the schools an author belongs to (without reading the author)"""
+        query = (self.db.collection(COLLECTIONS['schools'])
+                .where('author_ids', 'array_contains', author_id))
+
+        schools = []
+        async for doc in query.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            data['authors_count'] = len(data.get('author_ids', []))
+            schools.append(SchoolResponse(**data))
+
+        # Sorted here so the query needs no composite index
+        schools.sort(key=lambda school: school.nombre)
+        return schools
+
+    # =====================
+    # BOOKS OPERATIONS
+    # =====================
+
+    async def create_book(self, book_data: BookModel) -> str:
+        """Create a new book"""
+        book_dict = book_data.dict()
+        book_dict['created_at'] = datetime.utcnow()
+        book_dict['updated_at'] = datetime.utcnow()
+
+        db = self.db
+        await self._ensure_counters(db)
+        await self._embed_author_summary(db, book_dict)
+        doc_ref = db.collection(COLLECTIONS['books']).document()
+        author_id = book_dict.get('autor_id')
+        try:
+            await self._counted_batch(db, 'books', doc_ref, book_dict, author_id).commit()
+        except NotFound:
+            # Unknown author: there's no author counter to bump
+            await self._counted_batch(db, 'books', doc_ref, book_dict).commit()
+        self._index_document('books', doc_ref.id, book_dict)
+        return doc_ref.id
+
+    async def get_books(self, limit: int = 50, offset: int = 0, autor_id: Optional[str] = None, search_query: Optional[str] = None, author_memo: Optional[AuthorMemo] = None, start_after: Optional[str] = None, fields: Optional[Sequence[str]] = None) -> List[BookResponse]:
+        """Get books with pagination, optional author filter and search
+
+        With ``fields`` only those fields are read from Firestore, and the
+        authors are only joined when ``author`` is among them.
+        """
+        with_authors = fields is None or 'author' in fields
+        if search_query and self.search_index is not None:
+            # Ranked full-text results, paginated by offset
+            field_paths = projection(fields, required=['titulo'], computed=BOOK_COMPUTED_FIELDS)
+            page = await self._search('books', search_query, limit, offset, field_paths=field_paths, autor_id=autor_id)
+            return await self._books_with_authors(page, author_memo, with_authors)
+
+        query = self.db.collection(COLLECTIONS['books'])
+
+        if autor_id:
+            query = query.where('autor_id', '==', autor_id)
+
+        query = query.order_by('titulo').order_by('__name__')
+        if start_after:
+            query = query.start_after(start_after_values(start_after, 'titulo'))
+        query = query.offset(offset).limit(limit)
+        # The substring filter below needs the searched fields
+        required = ['titulo', 'descripcion'] if search_query else ['titulo']
+        field_paths = projection(fields, required=required, computed=BOOK_COMPUTED_FIELDS)
+        if field_paths is not None:
+            query = query.select(field_paths)
+
+        page = []
+        async for doc in query.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+
+            # Apply text search filter if provided
+            if search_query and not self._matches_search(data, search_query):
+                continue
+
+            page.append(data)
+
+        return await self._books_with_authors(page, author_memo, with_authors)
+
+    async def _books_with_authors(self, page: List[Dict[str, Any]], author_memo: Optional[AuthorMemo] = None, with_authors: bool = True) -> List[BookResponse]:
+        """Book responses with the author info joined in bulk"""
+        if not with_authors:
+            return [BookResponse(**data) for data in page]
+
+        # Get author information for frontend compatibility
+        authors_info = await self._get_authors_info(page, author_memo)
+
+        books = []
+        for data in page:
+            if data.get('autor_id'):
+                data['author'] = self._book_author(data, authors_info.get(data['autor_id']))
+            books.append(BookResponse(**data))
+
+        return books
+
+    async def count_books(self, autor_id: Optional[str] = None, search_query: Optional[str] = None) -> int:
+        """Count total books with optional filters"""
+        db = self.db
+        query = db.collection(COLLECTIONS['books'])
+
+        if autor_id:
+            query = query.where('autor_id', '==', autor_id)
+
+        if search_query and self.search_index is not None:
+            await self.search_index.ensure_ready(db)
+            return len(self.search_index.search('books', search_query, autor_id=autor_id))
+
+        if search_query:
+            # Filter by search query
+            docs = query.select(['titulo', 'descripcion']).stream()
+            return sum([1 async for doc in docs if self._matches_search(doc.to_dict(), search_query)])
+
+        # Maintained counters cost a single read
+        if autor_id:
+            counter_ref = db.collection(COLLECTIONS['authors']).document(autor_id)
+            count = self._counter_value(await counter_ref.get([AUTHOR_COUNTERS['books']]), AUTHOR_COUNTERS['books'])
+        else:
+            count = self._counter_value(await self._counters_ref(db).get(), 'books_count')
+
+        if count is None:
+            count = await self._aggregate_count(query)
+        return count
+
+    # =====================
+    # QUOTES OPERATIONS
+    # =====================
+
+    async def create_quote(self, quote_data: QuoteModel) -> str:
+        """Create a new quote"""
+        quote_dict = quote_data.dict()
+        quote_dict['created_at'] = datetime.utcnow()
+        quote_dict['updated_at'] = datetime.utcnow()
+        quote_dict[RANDOM_KEY_FIELD] = random.random()
+
+        db = self.db
+        await self._ensure_counters(db)
+        await self._embed_author_summary(db, quote_dict)
+        doc_ref = db.collection(COLLECTIONS['quotes']).document()
+        author_id = quote_dict.get('autor_id')
+        try:
+            await self._counted_batch(db, 'quotes', doc_ref, quote_dict, author_id).commit()
+        except NotFound:
+            # Unknown author: there's no author counter to bump
+            await self._counted_batch(db, 'quotes', doc_ref, quote_dict).commit()
+        self._index_document('quotes', doc_ref.id, quote_dict)
+        return doc_ref.id
+
+    async def get_quotes(self, limit: int = 50, autor_id: Optional[str] = None, start_after: Optional[str] = None, search_query: Optional[str] = None, offset: int = 0) -> List[QuoteResponse]:
+        """Get quotes (newest first), optionally filtered by author and after a cursor
+
+        With ``search_query`` the quotes are ranked by relevance instead.
+        """
+        if search_query and self.search_index is not None:
+            page = await self._search('quotes', search_query, limit, offset, autor_id=autor_id)
+            return [QuoteResponse(**data) for data in page]
+
+        query = self.db.collection(COLLECTIONS['quotes'])
+
+        if autor_id:
+            query = query.where('autor_id', '==', autor_id)
+
+        query = (query
+                .order_by('created_at', direction=firestore.Query.DESCENDING)
+                .order_by('__name__', direction=firestore.Query.DESCENDING))
+        if start_after:
+            query = query.start_after(start_after_values(start_after, 'created_at'))
+        query = query.offset(offset).limit(limit)
+
+        quotes = []
+        async for doc in query.stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            quotes.append(QuoteResponse(**data))
+
+        return quotes
+
+    async def get_random_quote(self) -> Optional[QuoteResponse]:
+        """Get a random quote"""
+        quotes = await self.get_random_quotes(1)
+        return quotes[0] if quotes else None
+
+    async def get_random_quotes(self, n: int = 1) -> List[QuoteResponse]:
+        """Get n distinct random quotes, one indexed read per quote
+
+        Each quote stores a uniform random key; every result is the first
+        quote whose key follows its own random pivot (wrapping around to the
+        start of the key space), so which quotes come back together is as
+        random as each one. Pivots landing on an already chosen quote are
+        redrawn a few times; a small collection may return fewer than n.
+        """
+        quotes_ref = self.db.collection(COLLECTIONS['quotes'])
+
+        async def pick(pivot: float):
+            docs = [doc async for doc in quotes_ref.where(RANDOM_KEY_FIELD, '>=', pivot).order_by(RANDOM_KEY_FIELD).limit(1).stream()]
+            if not docs:
+                docs = [doc async for doc in quotes_ref.order_by(RANDOM_KEY_FIELD).limit(1).stream()]
+            return docs[0] if docs else None
+
+        chosen = {}
+        for _ in range(RANDOM_QUOTE_ROUNDS):
+            picks = await asyncio.gather(*(pick(random.random()) for _ in range(n - len(chosen))))
+            for doc in picks:
+                if doc is not None:
+                    chosen.setdefault(doc.id, doc)
+            if len(chosen) == n or not any(picks):
+                break
+        docs = list(chosen.values())
+
+        if not docs:
+            # Quotes without random keys yet (run backfill-random-keys): sample the first ones
+            docs = [doc async for doc in quotes_ref.limit(100).stream()]
+            docs = random.sample(docs, min(n, len(docs)))
+
+        quotes = []
+        for doc in docs:
+            data = doc.to_dict()
+            data['id'] = doc.id
+            quotes.append(QuoteResponse(**data))
+
+        return quotes
+
+    async def backfill_random_keys(self) -> int:
+        """Add a random key to every quote that doesn't have one yet"""
+        db = self.db
+        batch = db.batch()
+        pending = 0
+        updated = 0
+
+        async for doc in db.collection(COLLECTIONS['quotes']).select([RANDOM_KEY_FIELD]).stream():
+            if (doc.to_dict() or {}).get(RANDOM_KEY_FIELD) is not None:
+                continue
+
+            batch.update(doc.reference, {RANDOM_KEY_FIELD: random.random()})
+            pending += 1
+            updated += 1
+            if pending == BATCH_LIMIT:
+                await batch.commit()
+                batch = db.batch()
+                pending = 0
+
+        if pending:
+            await batch.commit()
+        return updated
+
+    # =====================
+    # STATS OPERATIONS
+    # =====================
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get application statistics"""
+        db = self.db
+
+        # Maintained counters: a single read
+        counters = await self._counters_ref(db).get()
+        data = (counters.to_dict() or {}) if counters.exists else {}
+
+        stats = {}
+        for collection_name, collection_key in COLLECTIONS.items():
+            field = f'{collection_name}_count'
+            if data.get(field) is not None:
+                stats[field] = data[field]
+                continue
+
+            # Counter not initialised yet: count the collection server-side
+            try:
+                stats[field] = await self._aggregate_count(db.collection(collection_key))
+            except Exception as e:
+                print(f"Error counting {collection_name}: {e}")
+                stats[field] = 0
+
+        return stats
+
+    async def reconcile_counters(self) -> Dict[str, Any]:
+        """Recompute every maintained counter from the collections and fix drift"""
+        db = self.db
+
+        totals = {}
+        for name, key in COLLECTIONS.items():
+            totals[f'{name}_count'] = await self._aggregate_count(db.collection(key))
+
+        # Tally per-author counts reading only the autor_id field
+        tallies: Dict[str, Dict[str, int]] = {}
+        for collection_name, field in AUTHOR_COUNTERS.items():
+            async for doc in db.collection(COLLECTIONS[collection_name]).select(['autor_id']).stream():
+                author_id = (doc.to_dict() or {}).get('autor_id')
+                if author_id:
+                    tallies.setdefault(author_id, {}).setdefault(field, 0)
+                    tallies[author_id][field] += 1
+
+        # Only rewrite the authors whose stored counts drifted
+        batch = db.batch()
+        pending = 0
+        authors_updated = 0
+        counter_fields = list(AUTHOR_COUNTERS.values())
+        async for doc in db.collection(COLLECTIONS['authors']).select(counter_fields).stream():
+            stored = doc.to_dict() or {}
+            actual = {field: tallies.get(doc.id, {}).get(field, 0) for field in counter_fields}
+            if all(stored.get(field) == value for field, value in actual.items()):
+                continue
+
+            batch.update(doc.reference, actual)
+            pending += 1
+            authors_updated += 1
+            if pending == BATCH_LIMIT:
+                await batch.commit()
+                batch = db.batch()
+                pending = 0
+
+        batch.set(self._counters_ref(db), totals)
+        await batch.commit()
+
+        return {**totals, 'authors_updated': authors_updated}
+
+    # =====================
+    # HELPER METHODS
+    # =====================
+
+    async def _ensure_counters(self, db):
+        """Seed the maintained counters (with a reconcile) before the first increment
+
+        An Increment on a missing field starts from 0, so on a database
+        written before the counters existed the first write would leave
+        them counting only itself. Checked once per process.
+        """
+        if self._counters_seeded:
+            return
+        async with self._counters_lock:
+            if self._counters_seeded:
+                return
+            counters = await self._counters_ref(db).get()
+            data = (counters.to_dict() or {}) if counters.exists else {}
+            if any(data.get(f'{name}_count') is None for name in COLLECTIONS):
+                await self.reconcile_counters()
+            self._counters_seeded = True
+
+    async def _count_author_books(self, author_id: str) -> int:
+        """Count books by author"""
+        query = self.db.collection(COLLECTIONS['books']).where('autor_id', '==', author_id)
+        return await self._aggregate_count(query)
+
+    async def _count_author_quotes(self, author_id: str) -> int:
+        """Count quotes by author"""
+        query = self.db.collection(COLLECTIONS['quotes']).where('autor_id', '==', author_id)
+        return await self._aggregate_count(query)
+
+    @staticmethod
+    async def _aggregate_count(query) -> int:
+        """Count matching documents server-side with an aggregation query"""
+        result = await query.count(alias='count').get()
+        return int(result[0][0].value)
+
+    async def _search(self, collection_name: str, query: str, limit: int, offset: int, field_paths: Optional[List[str]] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """Ranked page of documents (or just ``field_paths`` of them) matching a text query"""
+        db = self.db
+        await self.search_index.ensure_ready(db)
+        doc_ids = self.search_index.search(collection_name, query, **filters)[offset:offset + limit]
+        if not doc_ids:
+            return []
+
+        collection_ref = db.collection(COLLECTIONS[collection_name])
+        found = {}
+        async for doc in db.get_all([collection_ref.document(doc_id) for doc_id in doc_ids], field_paths=field_paths):
+            if doc.exists:
+                data = doc.to_dict()
+                data['id'] = doc.id
+                found[doc.id] = data
+
+        # get_all doesn't keep the order of the references
+        return [found[doc_id] for doc_id in doc_ids if doc_id in found]
+
+    def _index_document(self, collection_name: str, doc_id: str, data: Dict[str, Any]):
+        """Make a newly written document searchable right away"""
+        if self.search_index is not None:
+            self.search_index.add(collection_name, doc_id, data)
+
+    async def _embed_author_summary(self, db, data: Dict[str, Any]):
+        """Embed the author summary on a new book or quote, so reads never join the author"""
+        author_id = data.get('autor_id')
+        if not author_id or data.get('autor_resumen'):
+            return
+        doc = await db.collection(COLLECTIONS['authors']).document(author_id).get(AUTHOR_INFO_FIELDS)
+        if doc.exists:
+            data['autor_resumen'] = self._author_summary(author_id, doc.to_dict())
+            data['autor_nombre'] = data['autor_resumen']['nombre']
+
+    async def _get_authors_info(self, books: List[Dict[str, Any]], memo: Optional[AuthorMemo] = None) -> AuthorMemo:
+        """Get basic author information for a page of books in bulk"""
+        memo = {} if memo is None else memo
+        missing = self._authors_to_fetch(books, memo)
+        if not missing:
+            return memo
+
+        try:
+            db = self.db
+            authors_ref = db.collection(COLLECTIONS['authors'])
+
+            # First try by ID, all at once
+            refs = [authors_ref.document(author_id) for author_id in missing]
+            async for doc in db.get_all(refs, field_paths=AUTHOR_INFO_FIELDS):
+                if doc.exists:
+                    memo[doc.id] = self._author_info(doc.to_dict())
+
+            # Fallback: search by name the ones not found by ID
+            by_name = self._missing_by_name(missing, memo)
+            names = list(by_name)
+            for i in range(0, len(names), IN_QUERY_LIMIT):
+                query = (authors_ref
+                        .where('nombre', 'in', names[i:i + IN_QUERY_LIMIT])
+                        .select(AUTHOR_INFO_FIELDS))
+                async for doc in query.stream():
+                    data = doc.to_dict()
+                    for author_id in by_name.get(data.get('nombre'), []):
+                        memo[author_id] = self._author_info(data)
+        except Exception as e:
+            print(f"Error getting author info for {list(missing)}: {e}")
+
+        return memo
+
+    # =====================
+    # BATCH OPERATIONS (for migration)
+    # =====================
+
+    async def batch_create_authors(self, authors: List[AuthorModel]) -> List[str]:
+        """Batch create authors"""
+        db = self.db
+        await self._ensure_counters(db)
+        batch = db.batch()
+        doc_ids = []
+        written = []
+
+        for author_data in authors:
+            doc_ref = db.collection(COLLECTIONS['authors']).document()
+            author_dict = author_data.dict()
+            author_dict['created_at'] = datetime.utcnow()
+            author_dict['updated_at'] = datetime.utcnow()
+            author_dict.update({field: 0 for field in AUTHOR_COUNTERS.values()})
+
+            batch.set(doc_ref, author_dict)
+            doc_ids.append(doc_ref.id)
+            written.append(author_dict)
+
+        batch.set(self._counters_ref(db), {'authors_count': firestore.Increment(len(doc_ids))}, merge=True)
+        await batch.commit()
+
+        for doc_id, author_dict in zip(doc_ids, written):
+            self._index_document('authors', doc_id, author_dict)
+        return doc_ids
@@ -0,0 +1,162 @@
+"""
+Concurrent batched writer for bulk Firestore loads
+"""
+import asyncio
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.api_core import exceptions as google_exceptions
+
+from .firestore_service import BATCH_LIMIT
+
+
+# Transient errors after which the whole batch is safe to commit again
+RETRYABLE_ERRORS = (
+    google_exceptions.Aborted,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+)
+
+# (operation, collection name, document reference, data)
+WriteOp = Tuple[str, str, Any, Optional[Dict[str, Any]]]
+
+
+def get_write_concurrency_from_env() -> int:
+    """Max batch commits in flight at once (FIRESTORE_WRITE_CONCURRENCY)"""
+    try:
+        return max(1, int(os.getenv("FIRESTORE_WRITE_CONCURRENCY", "8")))
+    except ValueError:
+        return 8
+
+
+class BatchWriter:
+    """Queues document writes and commits them in concurrent batches
+
+    Writes from any collection are grouped into batches of up to BATCH_LIMIT
+    operations. A batch is committed in the background as soon as it fills,
+    with at most ``concurrency`` commits in flight; transient failures are
+    retried with exponential backoff. Call flush() to commit the remainder
+    and wait for everything to land.
+    """
+
+    def __init__(self, db, batch_size: int = BATCH_LIMIT, concurrency: Optional[int] = None,
+                 max_retries: int = 5, base_delay: float = 0.5):
+        self.db = db
+        self.batch_size = min(batch_size, BATCH_LIMIT)
+        self.concurrency = concurrency or get_write_concurrency_from_env()
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+
+        self._pending: List[WriteOp] = []
+        self._tasks: List[asyncio.Task] = []
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._started_at: Optional[float] = None
+
+        # Metrics
+        self.queued = 0
+        self.written: Dict[str, int] = {}
+        self.batches = 0
+        self.retries = 0
+
+    def set(self, collection_name: str, doc_ref, data: Dict[str, Any]):
+        """Queue a document create/overwrite"""
+        self._queue(('set', collection_name, doc_ref, data))
+
+    def merge(self, collection_name: str, doc_ref, data: Dict[str, Any]):
+        """Queue a set that keeps the document's other fields"""
+        self._queue(('merge', collection_name, doc_ref, data))
+
+    def update(self, collection_name: str, doc_ref, data: Dict[str, Any]):
+        """Queue a partial update of an existing document"""
+        self._queue(('update', collection_name, doc_ref, data))
+
+    def delete(self, collection_name: str, doc_ref):
+        """Queue a document delete"""
+        self._queue(('delete', collection_name, doc_ref, None))
+
+    def _queue(self, op: WriteOp):
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        self._pending.append(op)
+        self.queued += 1
+        if len(self._pending) >= self.batch_size:
+            self._commit_pending()
+
+    def _commit_pending(self):
+        """Start committing the queued operations as one batch"""
+        if self._pending:
+            ops, self._pending = self._pending, []
+            self._tasks.append(asyncio.create_task(self._commit(ops)))
+
+    async def _commit(self, ops: List[WriteOp]):
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                # A committed batch can't be reused, so build a fresh one per attempt
+                batch = self.db.batch()
+                for operation, _, doc_ref, data in ops:
+                    if operation == 'delete':
+                        batch.delete(doc_ref)
+                    elif operation == 'merge':
+                        batch.set(doc_ref, data, merge=True)
+                    else:
+                        getattr(batch, operation)(doc_ref, data)
+
+                try:
+                    await batch.commit()
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+                    delay = self.base_delay * (2 ** attempt) * (0.5 + random.random())
+                    print(f"  ⚠️  Batch of {len(ops)} writes failed ({e}); retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+
+        self.batches += 1
+        for _, collection_name, _, _ in ops:
+            self.written[collection_name] = self.written.get(collection_name, 0) + 1
+        self.report()
+
+    async def throttle(self):
+        """Wait while too many batches are queued, so producers can't outrun the commits"""
+        while len(self._tasks) > self.concurrency:
+            done, _ = await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+            self._tasks = [task for task in self._tasks if task not in done]
+            for task in done:
+                # Surface a failed batch now rather than at flush()
+                task.result()
+
+    async def flush(self):
+        """Commit everything queued so far and wait for all batches to finish"""
+        self._commit_pending()
+        tasks, self._tasks = self._tasks, []
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Progress and throughput of the writes so far"""
+        total = sum(self.written.values())
+        elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "queued": self.queued,
+            "written": total,
+            "by_collection": dict(self.written),
+            "batches": self.batches,
+            "retries": self.retries,
+            "elapsed_seconds": round(elapsed, 2),
+            "docs_per_second": round(total / elapsed, 1) if elapsed else 0.0,
+        }
+
+    def report(self):
+        """Print a one-line progress/throughput summary"""
+        m = self.metrics()
+        per_collection = ", ".join(f"{name}: {count}" for name, count in sorted(m["by_collection"].items()))
+        print(f"  ⏫ {m['written']}/{m['queued']} docs written in {m['batches']} batches "
+              f"({per_collection}) - {m['elapsed_seconds']}s, {m['docs_per_second']} docs/s")
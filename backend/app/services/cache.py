@@ -0,0 +1,211 @@
+"""
+In-process read-through cache for the Firestore services
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+# Default time-to-live (seconds) per cached collection
+DEFAULT_TTLS = {
+    'authors': 300,
+    'schools': 600,
+    'books': 300,
+    'quotes': 300,
+    'stats': 60,
+}
+
+# Read methods served from the cache -> collection whose cache holds them
+CACHED_READS = {
+    'get_author': 'authors',
+    'author_exists': 'authors',
+    'get_authors': 'authors',
+    'search_authors': 'authors',
+    'get_school': 'schools',
+    'get_schools': 'schools',
+    'get_author_schools': 'schools',
+    'get_books': 'books',
+    'count_books': 'books',
+    'get_quotes': 'quotes',
+    'get_stats': 'stats',
+}
+
+# Write methods -> caches they make stale
+WRITE_INVALIDATES = {
+    'create_author': ('authors', 'books', 'stats'),
+    'batch_create_authors': ('authors', 'books', 'stats'),
+    'create_school': ('schools', 'stats'),
+    'create_book': ('books', 'authors', 'stats'),
+    'create_quote': ('quotes', 'authors', 'stats'),
+    'reconcile_counters': ('authors', 'books', 'stats'),
+    'update_author': ('authors', 'books', 'quotes'),
+    'refresh_author_summaries': ('books', 'quotes'),
+}
+
+_MISSING = object()
+
+
+def get_cache_settings_from_env() -> Tuple[Dict[str, float], int]:
+    """Get per-collection TTLs (CACHE_TTL_<COLLECTION>) and max entries (CACHE_MAX_ENTRIES)"""
+    ttls = {}
+    for collection, default in DEFAULT_TTLS.items():
+        try:
+            ttls[collection] = float(os.getenv(f"CACHE_TTL_{collection.upper()}", default))
+        except ValueError:
+            ttls[collection] = default
+
+    try:
+        max_entries = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    except ValueError:
+        max_entries = 1024
+
+    return ttls, max_entries
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, or _MISSING if absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry"""
+        self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        return {
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class CachedFirestoreService:
+    """Read-through cache in front of a Firestore service
+
+    Reads listed in CACHED_READS are answered from a per-collection TTL/LRU
+    cache; writes listed in WRITE_INVALIDATES clear the caches they affect.
+    Every other attribute is passed straight through to the wrapped service.
+    """
+
+    def __init__(self, service: Any, ttls: Optional[Dict[str, float]] = None, max_entries: Optional[int] = None):
+        env_ttls, env_max_entries = get_cache_settings_from_env()
+        ttls = {**env_ttls, **(ttls or {})}
+        max_entries = max_entries or env_max_entries
+
+        self.service = service
+        self.caches = {collection: TTLCache(ttl, max_entries) for collection, ttl in ttls.items()}
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        # Bumped by every invalidation, so loads that overlap a write don't cache
+        self._generations = {collection: 0 for collection in self.caches}
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.service, name)
+        if name in CACHED_READS:
+            return self._cached_read(CACHED_READS[name], name, attr)
+        if name in WRITE_INVALIDATES:
+            return self._invalidating_write(WRITE_INVALIDATES[name], attr)
+        return attr
+
+    def _cached_read(self, collection: str, name: str, method: Callable[..., Awaitable[Any]]):
+        cache = self.caches[collection]
+
+        async def read(*args, **kwargs):
+            try:
+                key = (name, args, frozenset(kwargs.items()))
+                hash(key)
+            except TypeError:
+                # Unhashable arguments (e.g. a shared memo dict): don't cache
+                return await method(*args, **kwargs)
+
+            value = cache.get(key)
+            if value is not _MISSING:
+                return value
+
+            # Concurrent misses for the same key share one Firestore call. It
+            # runs as its own task, so a caller being cancelled (e.g. a client
+            # disconnecting) never leaves the others waiting on it.
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(load(key, *args, **kwargs))
+                self._inflight[key] = task
+                task.add_done_callback(lambda done: self._finish(key, done))
+            return await asyncio.shield(task)
+
+        async def load(key, *args, **kwargs):
+            generation = self._generations[collection]
+            value = await method(*args, **kwargs)
+            # Lookups that failed or found nothing aren't worth remembering, and
+            # a write that landed meanwhile may have made the result stale
+            if value is not None and generation == self._generations[collection]:
+                cache.set(key, value)
+            return value
+
+        return read
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]"):
+        # An invalidation may already have replaced it with a newer load
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited anymore isn't logged
+            task.exception()
+
+    def _invalidating_write(self, collections: Tuple[str, ...], method: Callable[..., Awaitable[Any]]):
+        async def write(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self.invalidate(*collections)
+
+        return write
+
+    def invalidate(self, *collections: str):
+        """Clear the given collection caches (all of them if none given)
+
+        Loads already in flight for them finish for their current callers but
+        aren't cached, and later reads start a fresh load instead of joining them.
+        """
+        collections = [collection for collection in collections or tuple(self.caches) if collection in self.caches]
+        for collection in collections:
+            self._generations[collection] += 1
+            self.caches[collection].clear()
+
+        for key in [key for key in self._inflight if CACHED_READS[key[0]] in collections]:
+            del self._inflight[key]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-collection cache metrics"""
+        return {collection: cache.metrics() for collection, cache in self.caches.items()}
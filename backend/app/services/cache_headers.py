@@ -0,0 +1,146 @@
+"""
+HTTP caching for read endpoints: ETags, conditional GETs and Cache-Control
+"""
+import hashlib
+import os
+import re
+from typing import List, Optional, Pattern, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def cache_control(max_age: int, s_maxage: int, stale_while_revalidate: int) -> str:
+    """Cache-Control value for a public, cacheable response"""
+    return (f"public, max-age={max_age}, s-maxage={s_maxage}, "
+            f"stale-while-revalidate={stale_while_revalidate}")
+
+
+# First matching path pattern wins. Browsers keep responses briefly, shared
+# caches (CDN) longer, and both may serve a stale copy while revalidating
+# since the catalog only changes when a migration runs.
+CACHE_POLICIES: List[Tuple[Pattern, str]] = [
+    (re.compile(r"^/quotes/random/?$"), "no-store"),
+    (re.compile(r"^/(health|metrics)/?$"), "no-store"),
+    (re.compile(r"^/stats/?$"), cache_control(60, 300, 600)),
+    (re.compile(r"^/schools(/|$)"), cache_control(3600, 86400, 604800)),
+    (re.compile(r"^/(authors|books|quotes)(/|$)"), cache_control(300, 3600, 86400)),
+]
+
+# Anything else may be stored but must be revalidated (cheap thanks to the ETag)
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+# Headers kept on a 304, which replaces the cached response's metadata
+NOT_MODIFIED_HEADERS = ("cache-control", "etag", "vary", "expires", "last-modified")
+
+
+def get_http_cache_enabled_from_env() -> bool:
+    """Whether to send validators and Cache-Control headers (HTTP_CACHE_ENABLED)"""
+    return os.getenv("HTTP_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+def compute_etag(body: bytes) -> str:
+    """Weak ETag for a response body (weak: compression may re-encode the bytes)"""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """If-None-Match check, using the weak comparison the spec requires for GETs"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class CacheHeadersMiddleware:
+    """Adds ETag and Cache-Control to GET responses and answers If-None-Match with 304
+
+    Successful GET bodies are buffered and hashed, so the ETag changes
+    whenever the payload does (including a document's updated_at). An ETag
+    set by the route itself is kept. Responses to other methods, errors and
+    no-store routes pass through untouched apart from the Cache-Control
+    header.
+    """
+
+    def __init__(self, app: ASGIApp, policies: Optional[List[Tuple[Pattern, str]]] = None,
+                 default_cache_control: str = DEFAULT_CACHE_CONTROL):
+        self.app = app
+        self.policies = CACHE_POLICIES if policies is None else policies
+        self.default_cache_control = default_cache_control
+
+    def policy_for(self, path: str) -> str:
+        for pattern, value in self.policies:
+            if pattern.match(path):
+                return value
+        return self.default_cache_control
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.policy_for(scope["path"])
+        if scope["method"] == "HEAD" or policy == "no-store":
+            await self.app(scope, receive, self._with_cache_control(send, policy))
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                if start["status"] != 200:
+                    # Errors and redirects aren't cached
+                    passthrough = True
+                    await send(start)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            headers = MutableHeaders(scope=start)
+            if "cache-control" not in headers:
+                headers["Cache-Control"] = policy
+            etag = headers.get("etag") or compute_etag(body)
+            headers["ETag"] = etag
+
+            if if_none_match and etag_matches(etag, if_none_match):
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(name, value) for name, value in start["headers"]
+                                if name.decode("latin-1").lower() in NOT_MODIFIED_HEADERS],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _with_cache_control(send: Send, policy: str) -> Send:
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                if "cache-control" not in headers:
+                    headers["Cache-Control"] = policy
+            await send(message)
+        return send_wrapper
@@ -0,0 +1,105 @@
+"""
+Shared Firestore client pool
+"""
+import contextvars
+import inspect
+import itertools
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from google.cloud import firestore
+
+
+def get_pool_size_from_env() -> int:
+    """Get the number of Firestore clients (gRPC channels) to keep open"""
+    try:
+        return max(1, int(os.getenv("FIRESTORE_POOL_SIZE", "1")))
+    except ValueError:
+        return 1
+
+
+class FirestoreClientPool:
+    """Round-robin pool of long-lived Firestore clients
+
+    Every client owns its own gRPC channel, so building one per request means
+    a credential lookup and a TLS handshake each time. Clients are created
+    lazily on first use (so importing the app never needs credentials) and
+    then handed out in rotation for the lifetime of the process. A request
+    checks one client out and keeps using it, however many calls it makes.
+    """
+
+    def __init__(self, size: Optional[int] = None, client_factory: Callable[[], Any] = firestore.Client):
+        self.size = size or get_pool_size_from_env()
+        self._client_factory = client_factory
+        self._clients: List[Any] = []
+        self._next_slot = itertools.count()
+        self._lock = threading.Lock()
+        # Client checked out by the request running in this context
+        self._request_client: contextvars.ContextVar = contextvars.ContextVar(f"firestore_client_{id(self)}", default=None)
+
+        # Metrics
+        self.clients_created = 0
+        self.client_reuses = 0
+
+    def acquire(self) -> Any:
+        """Get the client checked out by the current request, or the next one in rotation"""
+        client = self._request_client.get()
+        if client is not None:
+            return client
+        return self._next_client()[0]
+
+    def checkout(self) -> Any:
+        """Pin a client to the current request (counted as a reuse if its channel was already open)"""
+        client, created = self._next_client()
+        if not created:
+            self.client_reuses += 1
+        self._request_client.set(client)
+        return client
+
+    def _next_client(self) -> Tuple[Any, bool]:
+        """Next client in rotation and whether it was just created"""
+        slot = next(self._next_slot) % self.size
+
+        if slot < len(self._clients):
+            return self._clients[slot], False
+
+        with self._lock:
+            if slot < len(self._clients):
+                return self._clients[slot], False
+            while len(self._clients) <= slot:
+                self._clients.append(self._client_factory())
+                self.clients_created += 1
+            return self._clients[slot], True
+
+    async def close(self):
+        """Close every open client's gRPC channel and empty the pool
+
+        The clients' own close() only releases their HTTP session, so the
+        channel is closed on the GAPIC transport; clients that never made a
+        call have none open.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, []
+        self._request_client.set(None)
+
+        for client in clients:
+            api = getattr(client, "_firestore_api_internal", None)
+            if api is None:
+                continue
+            try:
+                # AsyncClient's transport returns an awaitable, the sync one closes in place
+                closing = api.transport.close()
+                if inspect.isawaitable(closing):
+                    await closing
+            except Exception as e:
+                print(f"Error closing Firestore client: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Channel creation vs. reuse counters"""
+        return {
+            "pool_size": self.size,
+            "open_clients": len(self._clients),
+            "clients_created": self.clients_created,
+            "client_reuses": self.client_reuses,
+        }
@@ -0,0 +1,60 @@
+"""
+Sparse fieldsets (?fields=) for list endpoints
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+
+# Query value selecting every field of the full model
+ALL_FIELDS = "*"
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when ?fields= names fields the resource doesn't have"""
+
+
+def parse_fields(raw: Optional[str], model: Type[BaseModel], default: Sequence[str]) -> Tuple[str, ...]:
+    """Response fields for a ``fields`` query value
+
+    No value means the ``default`` summary, ``*`` every field of ``model``,
+    anything else a comma-separated list of its fields. The document ID is
+    always included.
+    """
+    if not raw or not raw.strip():
+        return tuple(default)
+    if raw.strip() == ALL_FIELDS:
+        return tuple(model.model_fields)
+
+    fields = [field.strip() for field in raw.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in model.model_fields]
+    if unknown:
+        raise InvalidFieldsError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(['id', *fields]))
+
+
+def projection(fields: Optional[Sequence[str]], required: Iterable[str] = (),
+               computed: Optional[Dict[str, Sequence[str]]] = None) -> Optional[List[str]]:
+    """Stored fields to read from Firestore for a fieldset (None reads whole documents)
+
+    ``required`` fields are always read (e.g. the sort field a cursor is
+    built from). ``computed`` maps response-only fields to the stored fields
+    they're derived from. The document ID is never a stored field.
+    """
+    if fields is None:
+        return None
+
+    computed = computed or {}
+    paths = list(required)
+    for field in fields:
+        if field in computed:
+            paths.extend(computed[field])
+        elif field != 'id':
+            paths.append(field)
+    return list(dict.fromkeys(paths))
+
+
+def project(items: Iterable[BaseModel], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """Response dicts holding only the requested fields"""
+    include = set(fields)
+    return [item.dict(include=include) for item in items]
@@ -0,0 +1,229 @@
+"""
+Rate-limited async HTTP fetcher with a content-addressed on-disk cache
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def get_fetcher_settings_from_env() -> Dict[str, Any]:
+    """Fetcher settings: SCRAPER_CONCURRENCY, SCRAPER_MIN_INTERVAL, SCRAPER_CACHE_MAX_AGE, SCRAPER_OFFLINE"""
+    return {
+        "concurrency": max(1, int(_env_float("SCRAPER_CONCURRENCY", 8))),
+        "min_interval": _env_float("SCRAPER_MIN_INTERVAL", 1.0),
+        "max_age": _env_float("SCRAPER_CACHE_MAX_AGE", 7 * 24 * 3600),
+        "offline": os.getenv("SCRAPER_OFFLINE", "false").lower() in ("1", "true", "yes"),
+    }
+
+
+def sha256_hex(data: bytes) -> str:
+    """Hex SHA-256 digest, used as the cache key of URLs and bodies"""
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    """A fetched (or cached) response body"""
+    url: str
+    content: bytes
+    sha256: str
+    from_cache: bool
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class CachedHTTPFetcher:
+    """Async HTTP GETs behind a content-addressed on-disk cache
+
+    Bodies are stored once per content hash under ``blobs/``; each URL maps
+    to its current hash plus the ETag/Last-Modified validators under
+    ``responses/``. Entries younger than ``max_age`` are served without any
+    request; older ones are revalidated with a conditional GET, so unchanged
+    pages cost a 304. Requests share one connection pool, run at most
+    ``concurrency`` at a time and at most one per ``min_interval`` seconds
+    per host. In offline mode only the cache is used.
+
+    Values derived from a body (e.g. an extracted biography) can be cached
+    next to it with derived(), keyed by the body hash so they're recomputed
+    only when the page actually changes.
+    """
+
+    def __init__(self, cache_dir: Path, headers: Optional[Dict[str, str]] = None, timeout: float = 10.0,
+                 concurrency: Optional[int] = None, min_interval: Optional[float] = None,
+                 max_age: Optional[float] = None, offline: Optional[bool] = None):
+        settings = get_fetcher_settings_from_env()
+        self.cache_dir = Path(cache_dir)
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.concurrency = concurrency or settings["concurrency"]
+        self.min_interval = settings["min_interval"] if min_interval is None else min_interval
+        self.max_age = settings["max_age"] if max_age is None else max_age
+        self.offline = settings["offline"] if offline is None else offline
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next_slot: Dict[str, float] = {}
+
+        # Metrics
+        self.cache_hits = 0
+        self.revalidated = 0
+        self.downloaded = 0
+        self.errors = 0
+
+    async def __aenter__(self) -> "CachedHTTPFetcher":
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # =====================
+    # FETCHING
+    # =====================
+
+    async def fetch(self, url: str) -> Optional[CachedPage]:
+        """Get a URL's body from the cache or the network (None if unavailable)"""
+        entry = self._load_entry(url)
+        cached = self._load_blob(entry['sha256']) if entry else None
+
+        if cached is not None and (self.offline or time.time() - entry['fetched_at'] < self.max_age):
+            self.cache_hits += 1
+            return CachedPage(url, cached, entry['sha256'], True)
+        if self.offline or self._client is None:
+            return CachedPage(url, cached, entry['sha256'], True) if cached is not None else None
+
+        headers = {}
+        if cached is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        await self._wait_for_host(urlsplit(url).netloc)
+        try:
+            async with self._semaphore:
+                response = await self._client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            self.errors += 1
+            print(f"Error fetching {url}: {e}")
+            # A stale copy beats nothing
+            return CachedPage(url, cached, entry['sha256'], True) if cached is not None else None
+
+        if response.status_code == 304 and cached is not None:
+            self.revalidated += 1
+            entry['fetched_at'] = time.time()
+            self._write_json(self._entry_path(url), entry)
+            return CachedPage(url, cached, entry['sha256'], True)
+
+        if response.status_code != 200:
+            self.errors += 1
+            print(f"Error fetching {url}: HTTP {response.status_code}")
+            return CachedPage(url, cached, entry['sha256'], True) if cached is not None else None
+
+        self.downloaded += 1
+        content = response.content
+        digest = sha256_hex(content)
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            self._write_bytes(blob_path, content)
+        self._write_json(self._entry_path(url), {
+            'url': url,
+            'sha256': digest,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'fetched_at': time.time(),
+        })
+        return CachedPage(url, content, digest, False)
+
+    async def _wait_for_host(self, host: str):
+        """Space out requests to the same host by min_interval"""
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._host_next_slot.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._host_next_slot[host] = time.monotonic() + self.min_interval
+
+    def derived(self, name: str, page: CachedPage, compute: Callable[[bytes], Any]) -> Any:
+        """Value computed from a page body, cached per body hash"""
+        path = self.cache_dir / 'derived' / name / f"{page.sha256}.json"
+        if path.exists():
+            try:
+                return json.loads(path.read_text(encoding='utf-8'))['value']
+            except (OSError, ValueError, KeyError):
+                pass
+
+        value = compute(page.content)
+        self._write_json(path, {'value': value})
+        return value
+
+    def metrics(self) -> Dict[str, int]:
+        """Where the responses came from"""
+        return {
+            "cache_hits": self.cache_hits,
+            "revalidated": self.revalidated,
+            "downloaded": self.downloaded,
+            "errors": self.errors,
+        }
+
+    # =====================
+    # CACHE STORAGE
+    # =====================
+
+    def _entry_path(self, url: str) -> Path:
+        return self.cache_dir / 'responses' / f"{sha256_hex(url.encode('utf-8'))}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.cache_dir / 'blobs' / digest[:2] / digest
+
+    def _load_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(url)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _load_blob(self, digest: str) -> Optional[bytes]:
+        try:
+            content = self._blob_path(digest).read_bytes()
+        except OSError:
+            return None
+        # Ignore a truncated or tampered blob
+        return content if sha256_hex(content) == digest else None
+
+    def _write_json(self, path: Path, data: Dict[str, Any]):
+        self._write_bytes(path, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _write_bytes(path: Path, data: bytes):
+        """Write atomically so an interrupted run never leaves a partial file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
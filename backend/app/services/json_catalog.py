@@ -0,0 +1,229 @@
+"""
+Mapping of the philosophers JSON export onto catalog documents
+"""
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from ..models.firestore_models import AuthorModel, AuthorRef, SchoolModel, BookModel, QuoteModel
+
+
+# School values that don't name a real school
+IGNORED_SCHOOLS = ['N/A', 'Unknown']
+
+# Natural keys usable verbatim as Firestore document IDs
+_PLAIN_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,128}")
+
+
+def document_id(*key_parts: Any) -> str:
+    """Deterministic document ID for a record's natural key"""
+    key = '-'.join(str(part) for part in key_parts)
+    if _PLAIN_ID_RE.fullmatch(key):
+        return key
+    # Keys with spaces, slashes etc. (or too long) are hashed instead
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+
+def author_document_id(philosopher: Dict[str, Any]) -> str:
+    """Author document ID (the philosopher's external ID)"""
+    return document_id(philosopher.get('id') or philosopher.get('name', ''))
+
+
+def school_document_id(school_name: str) -> str:
+    """School document ID for a school name"""
+    return document_id('school', school_name)
+
+
+def book_document_id(librivox_id: str) -> str:
+    """Book document ID for a LibriVox ID"""
+    return document_id('librivox', librivox_id)
+
+
+def quote_document_id(quote_data: Dict[str, Any]) -> str:
+    """Quote document ID (external ID, or author plus text)"""
+    external_id = quote_data.get('id', '')
+    if external_id:
+        return document_id(external_id)
+    return document_id('quote', quote_data.get('philosopher_id', ''), (quote_data.get('quote') or '').strip())
+
+
+def school_of(philosopher: Dict[str, Any]) -> Optional[str]:
+    """Name of a philosopher's school, or None if it doesn't name a real one"""
+    school = (philosopher.get('school') or '').strip()
+    return school if school and school not in IGNORED_SCHOOLS else None
+
+
+def get_librivox_books(philosopher: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """LibriVox books of a philosopher (built from the bare IDs when no details are given)"""
+    books = list(philosopher.get('librivox_books') or [])
+    if not books:
+        # Fallback: create books from just IDs
+        for librivox_id in philosopher.get('librivox_ids', []):
+            books.append({
+                'id': str(librivox_id),
+                'coverArtPath': f'/Images/LibriVox/{librivox_id}.jpg'
+            })
+    return books
+
+
+def get_librivox_ids(philosopher: Dict[str, Any]) -> List[str]:
+    """LibriVox IDs of a philosopher's books, as strings"""
+    return [str(book.get('id', '')) for book in get_librivox_books(philosopher)]
+
+
+def get_main_image_url(images_dict: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Extract main image URL from images dict"""
+    if not images_dict:
+        return None
+
+    # Try to get face image first
+    face_images = images_dict.get('face_images', {})
+    if face_images:
+        return face_images.get('face500x500', face_images.get('face250x250', ''))
+
+    # Fallback to full image
+    full_images = images_dict.get('full_images', {})
+    if full_images:
+        return full_images.get('full600x800', '')
+
+    return None
+
+
+def author_ref(philosopher: Dict[str, Any], author_id: str) -> AuthorRef:
+    """Author summary embedded on a philosopher's books and quotes"""
+    return AuthorRef(
+        id=author_id,
+        nombre=philosopher.get('name', ''),
+        imagen_url=get_main_image_url(philosopher.get('images', {}))
+    )
+
+
+def build_school(school_name: str, author_ids: List[str], now: Optional[datetime] = None) -> SchoolModel:
+    """School document for a school name"""
+    now = now or datetime.now(timezone.utc)
+    return SchoolModel(
+        nombre=school_name,
+        descripcion=f"Escuela filosófica: {school_name}",
+        author_ids=author_ids,
+        created_at=now,
+        updated_at=now
+    )
+
+
+def build_author(philosopher: Dict[str, Any], school_ids: List[str], biography: Optional[str] = None,
+                 now: Optional[datetime] = None) -> AuthorModel:
+    """Author document for a philosopher record"""
+    now = now or datetime.now(timezone.utc)
+
+    # Fallback to existing biography from JSON
+    if not biography:
+        biography = philosopher.get('biography', '')
+
+    return AuthorModel(
+        external_id=philosopher.get('id'),
+        nombre=philosopher.get('name', ''),
+        username=philosopher.get('username', ''),
+        vida=philosopher.get('life', ''),
+        descripcion_topica=philosopher.get('topical_description', ''),
+        areas_interes=philosopher.get('interests', ''),
+
+        # Dates from JSON
+        fecha_nacimiento_completa=philosopher.get('birth_date', ''),
+        fecha_muerte_completa=philosopher.get('death_date', ''),
+        año_nacimiento=philosopher.get('birth_year', ''),
+        año_muerte=philosopher.get('death_year', ''),
+
+        # Location
+        lugar_nacimiento=philosopher.get('birth_place', ''),
+
+        # School
+        escuela_principal=(philosopher.get('school') or '').strip(),
+        school_ids=school_ids,
+
+        # Links
+        enlace_iep=philosopher.get('iep_link', ''),
+        enlace_stanford=philosopher.get('spe_link', ''),
+        titulo_wiki=philosopher.get('wiki_title', ''),
+
+        # Images (keep JSON structure)
+        imagenes=philosopher.get('images', {}),
+        imagen_url=get_main_image_url(philosopher.get('images', {})),
+
+        # Books info
+        tiene_libros=philosopher.get('has_ebooks', False),
+        libros_librivox={
+            'librivox_ids': philosopher.get('librivox_ids', []),
+            'has_ebooks': philosopher.get('has_ebooks', False)
+        },
+
+        # Biography (extracted from IEP or from JSON)
+        biografia=biography or '',
+
+        created_at=now,
+        updated_at=now
+    )
+
+
+def build_book(philosopher: Dict[str, Any], book_data: Dict[str, Any], author_id: Optional[str],
+               now: Optional[datetime] = None) -> BookModel:
+    """Book document for one of a philosopher's LibriVox books"""
+    now = now or datetime.now(timezone.utc)
+    librivox_id = str(book_data.get('id', ''))
+    cover_path = book_data.get('coverArtPath', '')
+
+    # Build full image URLs
+    cover_art_url = ''
+    if cover_path:
+        if cover_path.startswith('/'):
+            cover_art_url = f"https://philosophersapi.com{cover_path}"
+        else:
+            cover_art_url = cover_path
+
+    return BookModel(
+        librivox_id=librivox_id,
+        titulo=f"Obra de {philosopher.get('name', 'Unknown')} (LibriVox {librivox_id})",
+        descripcion=f"Audiolibro disponible en LibriVox - ID: {librivox_id}",
+
+        # Cover art
+        imagen_url=cover_art_url,
+        cover_art_path=cover_path,
+
+        # LibriVox info
+        librivox_url=book_data.get('getRequestURL', f"https://librivox.org/api/feed/audiobooks/?id={librivox_id}"),
+        es_audiolibro=True,
+
+        # Author relationship
+        autor_id=author_id,
+        autor_nombre=philosopher.get('name', ''),
+        autor_resumen=author_ref(philosopher, author_id) if author_id else None,
+
+        created_at=now,
+        updated_at=now
+    )
+
+
+def build_quote(quote_data: Dict[str, Any], author: Optional[AuthorRef] = None,
+                now: Optional[datetime] = None) -> Optional[QuoteModel]:
+    """Quote document for a quote record and its author's summary (None if it has no text)"""
+    now = now or datetime.now(timezone.utc)
+    quote_text = (quote_data.get('quote') or '').strip()
+    if not quote_text:
+        return None
+
+    work = (quote_data.get('work') or '').strip()
+    year = (quote_data.get('year') or '').strip()
+
+    # Create quote (even without author match)
+    return QuoteModel(
+        external_id=quote_data.get('id', ''),
+        texto=quote_text,
+        obra=work if work else None,
+        año=year if year else None,
+        autor_id=author.id if author else None,
+        autor_nombre=author.nombre if author else None,
+        autor_resumen=author,
+        philosopher_external_id=quote_data.get('philosopher_id', ''),
+        created_at=now,
+        updated_at=now
+    )
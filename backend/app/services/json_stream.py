@@ -0,0 +1,151 @@
+"""
+Streaming readers for the philosophers dataset (JSON or NDJSON)
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+try:
+    import ijson
+except ImportError:  # optional: the built-in incremental parser is used instead
+    ijson = None
+
+
+# Top-level arrays of the JSON export -> record type used in NDJSON exports
+RECORD_TYPES = {
+    'philosophers': 'philosopher',
+    'quotes': 'quote',
+}
+
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+def iter_records(path: Path, collection: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of one collection ('philosophers' or 'quotes') one at a time
+
+    ``.ndjson``/``.jsonl`` files hold one record per line, tagged with a
+    ``type`` field ("philosopher" or "quote"; untagged lines with a
+    ``quote`` field count as quotes). Anything else is read as the bundled
+    JSON layout, ``{"philosophers": [...], "quotes": [...]}``, without ever
+    holding more than one record in memory.
+    """
+    path = Path(path)
+    if path.suffix in NDJSON_SUFFIXES:
+        yield from _iter_ndjson(path, RECORD_TYPES[collection])
+    elif ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, f'{collection}.item', use_float=True)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from _iter_json_array(f, collection)
+
+
+def _iter_ndjson(path: Path, record_type: str) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON record: {e}")
+
+            kind = record.get('type') or ('quote' if 'quote' in record else 'philosopher')
+            if kind == record_type:
+                yield record
+
+
+class _Reader:
+    """Chunked text buffer for decoding one JSON value at a time"""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> bool:
+        """Read another chunk, dropping what was already consumed"""
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Next non-whitespace character (without consuming it)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char is None or char not in chars:
+            raise ValueError(f"Malformed JSON: expected one of {chars!r}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self) -> Iterator[Any]:
+        """Decode the elements of the array starting at the cursor one by one"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(',]') == ']':
+                return
+
+
+def _iter_json_array(f: TextIO, key: str) -> Iterator[Any]:
+    """Elements of the top-level ``key`` array, skipping the other members item by item"""
+    reader = _Reader(f)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+
+    while True:
+        member = reader.value()
+        reader.expect(':')
+        if reader.peek() == '[':
+            items = reader.array_items()
+            if member == key:
+                yield from items
+                return
+            for _ in items:
+                pass
+        else:
+            reader.value()
+
+        if reader.expect(',}') == '}':
+            return
@@ -0,0 +1,296 @@
+"""
+Read-only catalog served from the bundled JSON, with no network I/O
+"""
+import os
+import random
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..models.firestore_models import (
+    AuthorRef, AuthorResponse, SchoolResponse, BookResponse, QuoteResponse, COLLECTIONS
+)
+from .firestore_service import FirestoreServiceBase
+from .json_catalog import (
+    build_school, build_author, build_book, build_quote, author_ref,
+    author_document_id, school_document_id, book_document_id, quote_document_id,
+    get_librivox_books, school_of
+)
+from .json_stream import iter_records
+from .pagination import InvalidCursorError, decode_cursor
+from .search_index import SEARCH_FIELDS, InvertedIndex
+
+
+DEFAULT_DATA_FILE = Path(__file__).resolve().parent.parent / "data" / "json" / "philosophers_complete_data.json"
+
+
+def get_local_data_file_from_env() -> Path:
+    """Data file served by the local catalog (LOCAL_CATALOG_FILE)"""
+    return Path(os.getenv("LOCAL_CATALOG_FILE", DEFAULT_DATA_FILE))
+
+
+class _SortedView:
+    """Documents kept in sort-key order, paginated by offset or keyset cursor"""
+
+    def __init__(self, items: List[Tuple[Tuple[Any, str], Any]], descending: bool = False):
+        items.sort(key=lambda item: item[0])
+        self.keys = [key for key, _ in items]
+        self.values = [value for _, value in items]
+        self.descending = descending
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def page(self, limit: int, offset: int = 0, start_after: Optional[str] = None) -> List[Any]:
+        if not self.descending:
+            start = self._position(start_after, bisect_right) if start_after else 0
+            start += offset
+            return self.values[start:start + limit]
+
+        end = self._position(start_after, bisect_left) if start_after else len(self.values)
+        end = max(0, end - offset)
+        return self.values[max(0, end - limit):end][::-1]
+
+    def _position(self, cursor: str, bisect) -> int:
+        """Index of a cursor's key; raises InvalidCursorError if it can't be ordered against the keys"""
+        try:
+            return bisect(self.keys, decode_cursor(cursor))
+        except TypeError:
+            # e.g. a name cursor on a date-sorted view
+            raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}")
+
+
+class LocalCatalogService:
+    """Same read interface as AsyncFirestoreService, answered from memory
+
+    Reads accept the same ``fields`` as the Firestore services but always
+    return whole documents (nothing to save in memory); the routers project
+    the response. The JSON export is mapped with the same builders as the migration (so
+    documents and IDs match what's in Firestore) and indexed once at
+    startup: by ID, by author, sorted by name/title/date, plus the search
+    indexes. Every read is then a dict lookup or list slice. Timestamps come
+    from the data file's modification time so they stay stable between
+    restarts. Writes aren't supported.
+    """
+
+    def __init__(self, data_file: Optional[Path] = None):
+        self.data_file = Path(data_file or get_local_data_file_from_env())
+        self.loaded_at: Optional[datetime] = None
+
+        self._authors: Dict[str, AuthorResponse] = {}
+        self._schools: Dict[str, SchoolResponse] = {}
+        self._books: Dict[str, BookResponse] = {}
+        self._quotes: Dict[str, QuoteResponse] = {}
+
+        self._authors_by_name = _SortedView([])
+        self._schools_by_name = _SortedView([])
+        self._schools_by_author: Dict[str, List[SchoolResponse]] = {}
+        self._books_by_title = _SortedView([])
+        self._books_by_author: Dict[str, _SortedView] = {}
+        self._quotes_by_date = _SortedView([], descending=True)
+        self._quotes_by_author: Dict[str, _SortedView] = {}
+        self._indexes = {name: InvertedIndex(fields) for name, fields in SEARCH_FIELDS.items()}
+
+    # =====================
+    # LOADING
+    # =====================
+
+    def load(self):
+        """Read and index the data file"""
+        if not self.data_file.exists():
+            raise FileNotFoundError(f"JSON file not found: {self.data_file}")
+
+        now = datetime.fromtimestamp(self.data_file.stat().st_mtime, tz=timezone.utc)
+        authors: Dict[str, Dict[str, Any]] = {}
+        names: Dict[str, str] = {}
+        refs: Dict[str, AuthorRef] = {}
+        school_authors: Dict[str, List[str]] = {}
+        books: Dict[str, Dict[str, Any]] = {}
+        quotes: Dict[str, Dict[str, Any]] = {}
+
+        for philosopher in iter_records(self.data_file, 'philosophers'):
+            author_id = author_document_id(philosopher)
+            names[philosopher.get('id')] = author_id
+            refs[author_id] = author_ref(philosopher, author_id)
+
+            school_ids = []
+            school = school_of(philosopher)
+            if school:
+                school_ids.append(school_document_id(school))
+                school_authors.setdefault(school, []).append(author_id)
+
+            # No scraping here: use the biography bundled with the export
+            author = build_author(philosopher, school_ids, philosopher.get('extracted_biography'), now=now)
+            authors[author_id] = {**author.dict(), 'id': author_id, 'books_count': 0, 'quotes_count': 0}
+
+            if philosopher.get('has_ebooks', False):
+                for book_data in get_librivox_books(philosopher):
+                    book_id = book_document_id(str(book_data.get('id', '')))
+                    # A recording shared by several philosophers belongs to the first
+                    if book_id not in books:
+                        books[book_id] = {**build_book(philosopher, book_data, author_id, now=now).dict(), 'id': book_id}
+                        authors[author_id]['books_count'] += 1
+
+        for quote_data in iter_records(self.data_file, 'quotes'):
+            author_id = names.get(quote_data.get('philosopher_id'))
+            quote = build_quote(quote_data, refs.get(author_id), now=now)
+            if quote is None:
+                continue
+            quotes[quote_document_id(quote_data)] = {**quote.dict(), 'id': quote_document_id(quote_data)}
+            if author_id:
+                authors[author_id]['quotes_count'] += 1
+
+        self._index(authors, school_authors, books, quotes, now)
+        self.loaded_at = now
+
+    def _index(self, authors, school_authors, books, quotes, now: datetime):
+        """Build the response objects and lookup structures"""
+        self._authors = {author_id: AuthorResponse(**data) for author_id, data in authors.items()}
+
+        self._schools = {}
+        for school, author_ids in school_authors.items():
+            school_id = school_document_id(school)
+            data = build_school(school, author_ids, now=now).dict()
+            self._schools[school_id] = SchoolResponse(**data, id=school_id, authors_count=len(author_ids))
+
+        self._books = {}
+        for book_id, data in books.items():
+            if data.get('autor_id'):
+                data['author'] = FirestoreServiceBase._book_author(data, data.get('autor_resumen'))
+            self._books[book_id] = BookResponse(**data)
+
+        self._quotes = {quote_id: QuoteResponse(**data) for quote_id, data in quotes.items()}
+
+        self._authors_by_name = _SortedView([((a.nombre or '', a.id), a) for a in self._authors.values()])
+        self._schools_by_name = _SortedView([((s.nombre or '', s.id), s) for s in self._schools.values()])
+        self._schools_by_author = {}
+        for school in self._schools_by_name.values:
+            for author_id in school.author_ids:
+                self._schools_by_author.setdefault(author_id, []).append(school)
+        self._books_by_title = _SortedView([((b.titulo or '', b.id), b) for b in self._books.values()])
+        self._quotes_by_date = _SortedView([((q.created_at, q.id), q) for q in self._quotes.values()], descending=True)
+
+        by_author: Dict[str, List] = {}
+        for book in self._books.values():
+            by_author.setdefault(book.autor_id, []).append(((book.titulo or '', book.id), book))
+        self._books_by_author = {author_id: _SortedView(items) for author_id, items in by_author.items()}
+
+        by_author = {}
+        for quote in self._quotes.values():
+            by_author.setdefault(quote.autor_id, []).append(((quote.created_at, quote.id), quote))
+        self._quotes_by_author = {author_id: _SortedView(items, descending=True) for author_id, items in by_author.items()}
+
+        self._indexes = {name: InvertedIndex(fields) for name, fields in SEARCH_FIELDS.items()}
+        for name, documents in (('authors', authors), ('books', books), ('quotes', quotes)):
+            for doc_id, data in documents.items():
+                self._indexes[name].add(doc_id, data)
+
+    def _search(self, collection_name: str, documents: Dict[str, Any], query: str, limit: int, offset: int, **filters):
+        doc_ids = self._indexes[collection_name].search(query, **filters)[offset:offset + limit]
+        return [documents[doc_id] for doc_id in doc_ids]
+
+    # =====================
+    # AUTHORS OPERATIONS
+    # =====================
+
+    async def get_author(self, author_id: str) -> Optional[AuthorResponse]:
+        """Get author by ID"""
+        return self._authors.get(author_id)
+
+    async def author_exists(self, author_id: str) -> bool:
+        """Check that an author exists"""
+        return author_id in self._authors
+
+    async def get_authors(self, limit: int = 50, offset: int = 0, start_after: Optional[str] = None, fields: Optional[Sequence[str]] = None) -> List[AuthorResponse]:
+        """Get paginated list of authors (by offset, or after a cursor)"""
+        return self._authors_by_name.page(limit, offset, start_after)
+
+    async def search_authors(self, query: str, limit: int = 20, offset: int = 0, fields: Optional[Sequence[str]] = None) -> List[AuthorResponse]:
+        """Search authors by name and areas of interest"""
+        return self._search('authors', self._authors, query, limit, offset)
+
+    # =====================
+    # SCHOOLS OPERATIONS
+    # =====================
+
+    async def get_school(self, school_id: str) -> Optional[SchoolResponse]:
+        """Get school by ID"""
+        return self._schools.get(school_id)
+
+    async def get_schools(self, limit: int = 50) -> List[SchoolResponse]:
+        """Get list of schools"""
+        return self._schools_by_name.page(limit)
+
+    async def get_author_schools(self, author_id: str) -> List[SchoolResponse]:
+        """Get the schools an author belongs to"""
+        return list(self._schools_by_author.get(author_id, ()))
+
+    # =====================
+    # BOOKS OPERATIONS
+    # =====================
+
+    async def get_books(self, limit: int = 50, offset: int = 0, autor_id: Optional[str] = None, search_query: Optional[str] = None, author_memo: Any = None, start_after: Optional[str] = None, fields: Optional[Sequence[str]] = None) -> List[BookResponse]:
+        """Get books with pagination, optional author filter and search"""
+        if search_query:
+            return self._search('books', self._books, search_query, limit, offset, autor_id=autor_id)
+
+        view = self._books_by_author.get(autor_id, _SortedView([])) if autor_id else self._books_by_title
+        return view.page(limit, offset, start_after)
+
+    async def count_books(self, autor_id: Optional[str] = None, search_query: Optional[str] = None) -> int:
+        """Count total books with optional filters"""
+        if search_query:
+            return len(self._indexes['books'].search(search_query, autor_id=autor_id))
+        if autor_id:
+            return len(self._books_by_author.get(autor_id, ()))
+        return len(self._books)
+
+    # =====================
+    # QUOTES OPERATIONS
+    # =====================
+
+    async def get_quotes(self, limit: int = 50, autor_id: Optional[str] = None, start_after: Optional[str] = None, search_query: Optional[str] = None, offset: int = 0) -> List[QuoteResponse]:
+        """Get quotes (newest first), optionally filtered by author and after a cursor"""
+        if search_query:
+            return self._search('quotes', self._quotes, search_query, limit, offset, autor_id=autor_id)
+
+        view = self._quotes_by_author.get(autor_id, _SortedView([])) if autor_id else self._quotes_by_date
+        return view.page(limit, offset, start_after)
+
+    async def get_random_quote(self) -> Optional[QuoteResponse]:
+        """Get a random quote"""
+        quotes = await self.get_random_quotes(1)
+        return quotes[0] if quotes else None
+
+    async def get_random_quotes(self, n: int = 1) -> List[QuoteResponse]:
+        """Get n distinct random quotes"""
+        quotes = self._quotes_by_date.values
+        return random.sample(quotes, min(n, len(quotes)))
+
+    # =====================
+    # STATS OPERATIONS
+    # =====================
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get application statistics"""
+        sizes = {
+            'authors': len(self._authors),
+            'schools': len(self._schools),
+            'books': len(self._books),
+            'quotes': len(self._quotes),
+        }
+        return {f'{name}_count': sizes[name] for name in COLLECTIONS}
+
+    def metrics(self) -> Dict[str, Any]:
+        """Loaded data file and document counts"""
+        return {
+            "data_file": str(self.data_file),
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "documents": {
+                "authors": len(self._authors),
+                "schools": len(self._schools),
+                "books": len(self._books),
+                "quotes": len(self._quotes),
+            },
+        }
@@ -0,0 +1,55 @@
+"""
+Opaque keyset cursors for paginated list endpoints
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor can't be decoded"""
+
+
+def encode_cursor(value: Any, doc_id: str) -> str:
+    """Encode the last sort value and document ID of a page into an opaque cursor"""
+    if isinstance(value, datetime):
+        value = {"$dt": value.isoformat()}
+    raw = json.dumps([value, doc_id], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor into (sort value, document ID); raises InvalidCursorError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, doc_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if isinstance(value, dict) and "$dt" in value:
+            value = datetime.fromisoformat(value["$dt"])
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}")
+
+    if not isinstance(doc_id, str):
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}")
+    return value, doc_id
+
+
+def start_after_values(cursor: str, field: str) -> dict:
+    """Values for Query.start_after from a cursor, ordered by field then document ID"""
+    value, doc_id = decode_cursor(cursor)
+    return {field: value, "__name__": doc_id}
+
+
+def next_cursor(items: List[BaseModel], field: str, limit: int) -> Optional[str]:
+    """Cursor of the page after ``items``, or None when this was the last page"""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, field), last.id)
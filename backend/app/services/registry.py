@@ -0,0 +1,109 @@
+"""
+App-scoped service registry shared by all routers
+"""
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request
+from google.cloud import firestore
+
+from .async_firestore_service import AsyncFirestoreService
+from .cache import CachedFirestoreService
+from .client_pool import FirestoreClientPool
+from .local_catalog_service import LocalCatalogService
+from .search_index import CatalogSearchIndex
+
+
+CATALOG_BACKENDS = ('firestore', 'local')
+
+
+def get_catalog_backend_from_env() -> str:
+    """Where reads are served from (CATALOG_BACKEND: 'firestore' or 'local')"""
+    backend = os.getenv("CATALOG_BACKEND", "firestore").lower()
+    if backend not in CATALOG_BACKENDS:
+        raise ValueError(f"Unknown CATALOG_BACKEND {backend!r} (expected one of {', '.join(CATALOG_BACKENDS)})")
+    return backend
+
+
+class ServiceRegistry:
+    """Holds the long-lived services for the lifetime of the app"""
+
+    def __init__(self, pool_size: Optional[int] = None, backend: Optional[str] = None):
+        self.pool_size = pool_size
+        self.backend = backend or get_catalog_backend_from_env()
+        self.local_catalog: Optional[LocalCatalogService] = None
+        self.firestore_pool: Optional[FirestoreClientPool] = None
+        self.firestore_service: Optional[AsyncFirestoreService] = None
+        self.cache: Optional[CachedFirestoreService] = None
+        self.search_index: Optional[CatalogSearchIndex] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        """Create the shared client pool and services"""
+        if self.backend == 'local':
+            # Whole catalog in memory: no clients, cache or search refresh needed
+            self.local_catalog = LocalCatalogService()
+            self.local_catalog.load()
+            return
+
+        # Async clients so Firestore RPCs never block the event loop
+        self.firestore_pool = FirestoreClientPool(size=self.pool_size, client_factory=firestore.AsyncClient)
+        self.search_index = CatalogSearchIndex()
+        self.firestore_service = AsyncFirestoreService(pool=self.firestore_pool, search_index=self.search_index)
+
+        # The catalog rarely changes, so reads go through an in-process cache
+        if os.getenv("CACHE_ENABLED", "true").lower() not in ("0", "false", "no"):
+            self.cache = CachedFirestoreService(self.firestore_service)
+
+    def start_background_tasks(self):
+        """Start periodic jobs (must be called from the running event loop)"""
+        if self.search_index is None:
+            return
+        self._tasks.append(asyncio.create_task(
+            self.search_index.run_periodic_refresh(lambda: self.firestore_pool.acquire())
+        ))
+
+    async def stop(self):
+        """Cancel background jobs and release the pooled clients"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+        if self.firestore_pool is not None:
+            await self.firestore_pool.close()
+        self.firestore_pool = None
+        self.local_catalog = None
+        self.firestore_service = None
+        self.cache = None
+        self.search_index = None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Runtime metrics of the shared services"""
+        return {
+            "backend": self.backend,
+            "local_catalog": self.local_catalog.metrics() if self.local_catalog else None,
+            "firestore_pool": self.firestore_pool.metrics() if self.firestore_pool else None,
+            "cache": self.cache.metrics() if self.cache else None,
+            "search_index": self.search_index.metrics() if self.search_index else None,
+        }
+
+
+def get_registry(request: Request) -> ServiceRegistry:
+    """Get the registry started by the app lifespan (or start one lazily)"""
+    registry = getattr(request.app.state, "services", None)
+    if registry is None:
+        # App was run without its lifespan (e.g. a bare TestClient)
+        registry = ServiceRegistry()
+        registry.start()
+        request.app.state.services = registry
+    return registry
+
+
+async def get_firestore_service(request: Request) -> AsyncFirestoreService:
+    """Dependency to get the shared catalog service (Firestore behind the cache, or the local catalog)"""
+    registry = get_registry(request)
+    if registry.firestore_pool is not None:
+        # async so the checked-out client stays pinned to the request's context
+        registry.firestore_pool.checkout()
+    return registry.local_catalog or registry.cache or registry.firestore_service
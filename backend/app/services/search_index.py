@@ -0,0 +1,281 @@
+"""
+In-process full-text search index over the catalog
+"""
+import asyncio
+import math
+import os
+import re
+import time
+import unicodedata
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.firestore_models import COLLECTIONS
+
+
+# Indexed text fields and their weights, per collection
+SEARCH_FIELDS = {
+    'authors': {'nombre': 3.0, 'areas_interes': 1.0},
+    'books': {'titulo': 2.0, 'descripcion': 1.0, 'autor_nombre': 0.5},
+    'quotes': {'texto': 1.0, 'obra': 1.0, 'autor_nombre': 0.5},
+}
+
+# Non-text fields kept per document so results can be filtered
+FILTER_FIELDS = ['autor_id']
+
+# Common Spanish/English words that carry no meaning on their own
+STOPWORDS = frozenset("""
+a al and as at by de del el en es for from in is la las lo los o of on or por
+para que se the to un una y
+""".split())
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Max vocabulary terms a trailing prefix expands to
+PREFIX_EXPANSIONS = 50
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def get_refresh_interval_from_env() -> float:
+    """Seconds between incremental index refreshes (SEARCH_REFRESH_SECONDS)"""
+    try:
+        return float(os.getenv("SEARCH_REFRESH_SECONDS", "300"))
+    except ValueError:
+        return 300.0
+
+
+def get_rebuild_interval_from_env() -> float:
+    """Seconds between full index rebuilds, which drop deleted documents (SEARCH_REBUILD_SECONDS)"""
+    try:
+        return float(os.getenv("SEARCH_REBUILD_SECONDS", "3600"))
+    except ValueError:
+        return 3600.0
+
+
+def fold(text: str) -> str:
+    """Case- and accent-fold text ("Sócrates" -> "socrates")"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into folded tokens, dropping stopwords"""
+    if not text:
+        return []
+    return [token for token in _TOKEN_RE.findall(fold(str(text))) if token not in STOPWORDS]
+
+
+class InvertedIndex:
+    """BM25-ranked inverted index over the documents of one collection"""
+
+    def __init__(self, fields: Dict[str, float]):
+        self.fields = fields
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_len: Dict[str, float] = {}
+        self._attrs: Dict[str, Dict[str, Any]] = {}
+        self._total_len = 0.0
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, doc_id: str, data: Dict[str, Any]):
+        """Index a document, replacing any previous version of it"""
+        self.remove(doc_id)
+
+        terms: Dict[str, float] = {}
+        for field, weight in self.fields.items():
+            for token in tokenize(data.get(field)):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        length = sum(terms.values())
+        self._doc_terms[doc_id] = terms
+        self._doc_len[doc_id] = length
+        self._total_len += length
+        self._attrs[doc_id] = {field: data.get(field) for field in FILTER_FIELDS}
+
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary = None
+            postings[doc_id] = frequency
+
+    def remove(self, doc_id: str):
+        """Drop a document from the index"""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+
+        self._total_len -= self._doc_len.pop(doc_id)
+        self._attrs.pop(doc_id, None)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Vocabulary terms starting with prefix"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+
+        terms = []
+        for term in self._vocabulary[bisect_left(self._vocabulary, prefix):]:
+            if not term.startswith(prefix) or len(terms) == PREFIX_EXPANSIONS:
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, **filters: Any) -> List[str]:
+        """IDs of the documents matching every query term, best BM25 score first
+
+        The last term also matches as a prefix, so partial input
+        ("Kan" -> "Kant") works like the old prefix search did.
+        """
+        tokens = tokenize(query)
+        if not tokens or not self._doc_terms:
+            return []
+
+        groups = [[token] for token in tokens[:-1]] + [self._expand(tokens[-1])]
+        total_docs = len(self._doc_terms)
+        avg_len = (self._total_len / total_docs) or 1.0
+
+        scores: Optional[Dict[str, float]] = None
+        for group in groups:
+            group_scores: Dict[str, float] = {}
+            for term in group:
+                postings = self._postings.get(term, {})
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = K1 * (1 - B + B * self._doc_len[doc_id] / avg_len)
+                    group_scores[doc_id] = group_scores.get(doc_id, 0.0) + idf * frequency * (K1 + 1) / (frequency + norm)
+
+            if scores is None:
+                scores = group_scores
+            else:
+                scores = {doc_id: score + group_scores[doc_id] for doc_id, score in scores.items() if doc_id in group_scores}
+            if not scores:
+                return []
+
+        active_filters = {field: value for field, value in filters.items() if value is not None}
+        results = [
+            (doc_id, score) for doc_id, score in scores.items()
+            if all(self._attrs[doc_id].get(field) == value for field, value in active_filters.items())
+        ]
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return [doc_id for doc_id, _ in results]
+
+
+class CatalogSearchIndex:
+    """Search indexes for authors, books and quotes, kept fresh incrementally
+
+    The first search builds the indexes from Firestore (projected to the
+    indexed fields); after that only documents whose updated_at moved past
+    the last seen value are re-read, and writes made through the service
+    are indexed immediately. Deletions leave no updated_at to notice, so
+    every ``rebuild_interval`` the refresh rebuilds the indexes from
+    scratch instead, dropping documents that no longer exist.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = None, rebuild_interval: Optional[float] = None):
+        self.refresh_interval = refresh_interval or get_refresh_interval_from_env()
+        self.rebuild_interval = rebuild_interval or get_rebuild_interval_from_env()
+        self.indexes = {name: InvertedIndex(fields) for name, fields in SEARCH_FIELDS.items()}
+        self._watermarks: Dict[str, Optional[datetime]] = {name: None for name in SEARCH_FIELDS}
+        self._built_at: Optional[float] = None
+        # Writes made while a rebuild streams a collection, replayed before the swap
+        self._pending: Dict[str, Optional[List[Tuple[str, Dict[str, Any]]]]] = {name: None for name in SEARCH_FIELDS}
+        self._lock = asyncio.Lock()
+        self.ready = False
+        self.refreshes = 0
+        self.rebuilds = 0
+
+    async def ensure_ready(self, db):
+        """Build the indexes on first use"""
+        if self.ready:
+            return
+        async with self._lock:
+            # Concurrent first searches share one build
+            if not self.ready:
+                await self._refresh(db)
+
+    async def refresh(self, db):
+        """Index every document created or updated since the last refresh (or rebuild, when due)"""
+        async with self._lock:
+            await self._refresh(db)
+
+    async def _refresh(self, db):
+        rebuild = self._built_at is None or time.monotonic() - self._built_at >= self.rebuild_interval
+        for name in list(self.indexes):
+            index = self.indexes[name]
+            fields = list(index.fields) + FILTER_FIELDS + ['updated_at']
+            query = db.collection(COLLECTIONS[name]).select(fields)
+
+            watermark = None if rebuild else self._watermarks[name]
+            if watermark is not None:
+                query = query.where('updated_at', '>=', watermark)
+            if rebuild:
+                # Searches keep using the current index until the new one is complete
+                index = InvertedIndex(index.fields)
+                self._pending[name] = []
+
+            try:
+                async for doc in query.stream():
+                    data = doc.to_dict() or {}
+                    index.add(doc.id, data)
+                    updated_at = data.get('updated_at')
+                    if updated_at is not None and (watermark is None or updated_at > watermark):
+                        watermark = updated_at
+
+                # The stream may predate them, so they go in last
+                for doc_id, data in self._pending[name] or ():
+                    index.add(doc_id, data)
+            finally:
+                self._pending[name] = None
+
+            self.indexes[name] = index
+            self._watermarks[name] = watermark
+
+        if rebuild:
+            self._built_at = time.monotonic()
+            self.rebuilds += 1
+        self.ready = True
+        self.refreshes += 1
+
+    async def run_periodic_refresh(self, get_db):
+        """Background loop refreshing the indexes once they've been built"""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            if not self.ready:
+                continue
+            try:
+                await self.refresh(get_db())
+            except Exception as e:
+                print(f"Error refreshing search index: {e}")
+
+    def add(self, collection_name: str, doc_id: str, data: Dict[str, Any]):
+        """Index a document written through the service"""
+        if self._pending[collection_name] is not None:
+            self._pending[collection_name].append((doc_id, data))
+        if self.ready:
+            self.indexes[collection_name].add(doc_id, data)
+
+    def search(self, collection_name: str, query: str, **filters: Any) -> List[str]:
+        """Ranked IDs of the matching documents"""
+        return self.indexes[collection_name].search(query, **filters)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Index sizes and refresh count"""
+        return {
+            "ready": self.ready,
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+            "documents": {name: len(index) for name, index in self.indexes.items()},
+        }